@@ -59,6 +59,9 @@ class ProfileAdmin(DefaultQueryMixin, admin.ModelAdmin):
         "Should_alert",
     ]
 
+    def get_queryset(self, request):
+        return Profile.objects.with_drafts(super().get_queryset(request))
+
     @admin.display(boolean=True)
     def Has_election(self, profile: Profile):
         return profile.has_election
@@ -1,11 +1,13 @@
 from __future__ import annotations
 
-from datetime import timedelta
-from typing import TYPE_CHECKING
+import time
+from concurrent.futures import Future, ThreadPoolExecutor, as_completed
+from typing import TYPE_CHECKING, Iterable
 
 from django.conf import settings
 from django.contrib.auth.models import User
-from django.core.mail import EmailMessage
+from django.core.mail import EmailMessage, get_connection
+from django.db.models import Q
 from django.template.loader import render_to_string
 from django.utils import timezone
 
@@ -21,13 +23,13 @@ if TYPE_CHECKING:
     from ballotbuddies.buddies.models import Voter
 
 
-def update_profiles():
-    age = timezone.now() - timedelta(days=1, hours=1)
-    query = Profile.objects.filter(updated_at__lte=age)
+def update_profiles() -> int:
+    pending = Message.objects.filter_unsent().values("profile")
+    query = Profile.objects.filter(Q(will_alert=True) | Q(pk__in=pending))
     log.info(f"Updating {query.count()} profiles(s)")
-    profile: Profile
-    for profile in query:
-        profile.save()
+    count = Profile.objects.refresh(query)
+    log.info(f"Changed alert status for {count} profile(s)")
+    return count
 
 
 def get_login_email(user: User):
@@ -85,6 +87,25 @@ def send_invite_email(user: User, friend: Voter, *, debug=False):
             log.info(f"Sent invite email: {user}")
 
 
+def send_invite_emails(users: Iterable[User], friend: Voter) -> int:
+    users = list(users)
+    debug = set(
+        Profile.objects.filter(voter__user__in=users, always_alert=True).values_list(
+            "voter__user", flat=True
+        )
+    )
+    emails = []
+    for user in users:
+        if user.email.endswith("@example.com"):
+            log.warn(f"Skipped invite email for test user: {user}")
+        else:
+            extra = " [debug]" if user.pk in debug else ""
+            emails.append(get_invite_email(user, friend, extra=extra))
+    count = send_messages(emails) if emails else 0
+    log.info(f"Sent {count} invite email(s) from {friend}")
+    return count
+
+
 def get_activity_email(
     user: User,
     *,
@@ -135,18 +156,93 @@ def send_activity_email(user: User, *, force: bool = False) -> bool:
     return False
 
 
-def send_activity_emails(day: str) -> int:
+def send_activity_emails(
+    day: str, *, batch_size: int = 100, connections: int = 1
+) -> int:
     if day and timezone.now().strftime("%A") != day:
         log.warn(f"Emails are only sent on {day}")
         return 0
 
-    count = 0
-    for profile in Profile.objects.filter(will_alert=True):
-        send_activity_email(profile.voter.user)
-        count += 1
+    count = sent = 0
+    start = time.monotonic()
+    query = Profile.objects.filter(will_alert=True).select_related("voter__user")
+
+    with ThreadPoolExecutor(max_workers=connections) as executor:
+        futures: dict[Future, list[tuple[Profile, Message]]] = {}
+
+        def submit(profiles: list[Profile]):
+            recipients = []
+            emails = []
+            drafts = Message.objects.get_drafts(profiles)
+            for profile in profiles:
+                user = profile.voter.user
+                message = drafts[profile.pk]
+                if email := get_activity_email(user, profile=profile, message=message):
+                    if user.email.endswith("@example.com"):
+                        log.warn(f"Skipped activity email for test user: {user}")
+                    else:
+                        recipients.append((profile, message))
+                        emails.append(email)
+            if emails:
+                futures[executor.submit(send_messages, emails)] = recipients
+
+        def finish(future: Future) -> int:
+            recipients = futures.pop(future)
+            try:
+                future.result()
+            except Exception as e:  # pylint: disable=broad-except
+                log.error(f"Unable to send {len(recipients)} email(s): {e}")
+                return 0
+            mark_alerted(recipients)
+            return len(recipients)
+
+        profiles: list[Profile] = []
+        for profile in query.iterator(chunk_size=batch_size):
+            profiles.append(profile)
+            count += 1
+            if len(profiles) >= batch_size:
+                submit(profiles)
+                profiles = []
+                for future in [f for f in futures if f.done()]:
+                    sent += finish(future)
+        submit(profiles)
+
+        for future in as_completed(list(futures)):
+            sent += finish(future)
+
+    elapsed = time.monotonic() - start
+    rate = sent / elapsed if elapsed else 0.0
+    log.info(f"Sent {sent} activity email(s) in {elapsed:.1f}s ({rate:.1f}/s)")
     return count
 
 
+def send_messages(emails: list[EmailMessage]) -> int:
+    with get_connection(fail_silently=False) as connection:
+        return connection.send_messages(emails) or 0
+
+
+def mark_alerted(recipients: list[tuple[Profile, Message]]):
+    now = timezone.now()
+    profiles = []
+    messages = []
+    for profile, message in recipients:
+        log.info(f"Sent activity email: {profile.voter.user}")
+        profile.last_alerted = now
+        profile.staleness = profile.compute_staleness()
+        profile.will_alert = False
+        profile.updated_at = now
+        profiles.append(profile)
+        message.mark_sent(save=False)
+        message.updated_at = now
+        messages.append(message)
+    Profile.objects.bulk_update(
+        profiles, ["last_alerted", "staleness", "will_alert", "updated_at"]
+    )
+    Message.objects.bulk_update(
+        [m for m in messages if m.pk], ["sent", "sent_at", "updated_at"]
+    )
+
+
 def get_voted_email(user: User):
     voter: Voter = user.voter
 
@@ -1,7 +1,8 @@
 from __future__ import annotations
 
 from datetime import timedelta
-from typing import TYPE_CHECKING
+from functools import cached_property
+from typing import TYPE_CHECKING, Iterable
 
 from django.db import models
 from django.utils import timezone
@@ -15,6 +16,68 @@ if TYPE_CHECKING:
     from ballotbuddies.buddies.models import Voter
 
 
+class ProfileManager(models.Manager["Profile"]):
+    def with_drafts(self, query: models.QuerySet[Profile] | None = None):
+        profiles = self.all() if query is None else query
+        drafts = Message.objects.filter(sent=False)
+        return profiles.select_related("voter__user").prefetch_related(
+            models.Prefetch("message_set", queryset=drafts, to_attr="drafts")
+        )
+
+    def alert(self, voter: Voter, recipients: dict[int, bool]) -> int:
+        profiles = {
+            profile.voter_id: profile  # type: ignore[attr-defined]
+            for profile in self.filter(voter_id__in=recipients)
+        }
+        missing = [Profile(voter_id=pk) for pk in recipients if pk not in profiles]
+        for profile in self.bulk_create(missing):
+            profiles[profile.voter_id] = profile  # type: ignore[attr-defined]
+        drafts = Message.objects.get_drafts(profiles.values())
+
+        messages = []
+        for pk, friend in recipients.items():
+            message = drafts[profiles[pk].pk]
+            if message.allows(friend):
+                message.add(voter, save=False)
+                message.updated_at = timezone.now()
+                messages.append(message)
+
+        Message.objects.bulk_create([m for m in messages if m.pk is None])
+        Message.objects.bulk_update(
+            [m for m in messages if m.pk], ["activity", "updated_at"]
+        )
+        self.refresh(self.filter(pk__in=[m.profile_id for m in messages]))
+        return len(messages)
+
+    def refresh(self, query: models.QuerySet[Profile], *, batch_size=500) -> int:
+        changed = 0
+        batch: list[Profile] = []
+        profiles = query.select_related("voter__user").iterator(chunk_size=batch_size)
+        for profile in profiles:
+            batch.append(profile)
+            if len(batch) >= batch_size:
+                changed += self._refresh(batch)
+                batch = []
+        changed += self._refresh(batch)
+        return changed
+
+    def _refresh(self, profiles: list[Profile]) -> int:
+        pending = set(
+            Message.objects.filter_unsent()
+            .filter(profile__in=profiles)
+            .values_list("profile_id", flat=True)
+        )
+        changed = []
+        for profile in profiles:
+            will_alert = profile.will_alert
+            profile.staleness = profile.compute_staleness()
+            profile.will_alert = profile.compute_will_alert(profile.pk in pending)
+            if profile.will_alert != will_alert:
+                changed.append(profile)
+        self.bulk_update(changed, ["staleness", "will_alert"])
+        return len(changed)
+
+
 class Profile(models.Model):
     voter: Voter = AutoOneToOneField("buddies.Voter", on_delete=models.CASCADE)
 
@@ -28,6 +91,8 @@ class Profile(models.Model):
 
     updated_at = models.DateTimeField(auto_now=True)
 
+    objects: ProfileManager = ProfileManager()
+
     class Meta:
         ordering = ["-last_viewed"]
 
@@ -41,8 +106,10 @@ class Profile(models.Model):
     def has_election(self) -> bool:
         return bool(self.voter.progress.election.date)
 
-    @property
+    @cached_property
     def message(self) -> Message:
+        if hasattr(self, "drafts"):
+            return self.drafts[0] if self.drafts else Message(profile=self)
         return Message.objects.get_draft(self)
 
     @property
@@ -71,27 +138,35 @@ class Profile(models.Model):
             return self.staleness > timedelta(days=30)
 
     def alert(self, voter: Voter, friend: bool = True) -> bool:
-        if len(self.message) >= 8:
+        message = self.message
+        if not message.allows(friend):
             return False
-        if len(self.message) >= 3 and not friend:
-            return False
-        self.message.add(voter)
+        message.add(voter)
+        if not self.will_alert and self.compute_will_alert(True):
+            Profile.objects.filter(pk=self.pk).update(will_alert=True)
+            self.will_alert = True
         return True
 
+    def compute_will_alert(self, has_message: bool) -> bool:
+        return all((self.has_election, has_message, self.should_alert))
+
     def mark_alerted(self, *, save=True):
         self.last_alerted = timezone.now()
         if save:
-            self.message.mark_sent()
+            if self.message.pk:
+                self.message.mark_sent()
+            self.__dict__.pop("message", None)
             self.save()
 
     def mark_viewed(self, *, save=True):
         self.last_viewed = timezone.now()
         if save:
-            if not self.always_alert:
+            if not self.always_alert and self.message.pk:
                 self.message.mark_read()
+                self.__dict__.pop("message", None)
             self.save()
 
-    def _staleness(self) -> timedelta:
+    def compute_staleness(self) -> timedelta:
         now = timezone.now()
         self.last_alerted = self.last_alerted or now
         self.last_viewed = self.last_viewed or now
@@ -99,21 +174,24 @@ class Profile(models.Model):
         return timedelta(seconds=int(delta.total_seconds()))
 
     def save(self, **kwargs):
-        self.staleness = self._staleness()
+        self.staleness = self.compute_staleness()
         if self.pk:
-            self.will_alert = all(
-                (self.has_election, self.has_message, self.should_alert)
-            )
+            self.will_alert = self.compute_will_alert(self.has_message)
         super().save(**kwargs)
 
 
-class MessageManager(models.Manager):
-    def get_draft(self, profile: Profile):
+class MessageManager(models.Manager["Message"]):
+    def get_draft(self, profile: Profile) -> Message:
         message = self.filter(profile=profile, sent=False).first()
-        if message is None:
-            message = self.create(profile=profile, sent=False)
-            log.debug(f"Drafted new message: {message}")
-        return message
+        return message or Message(profile=profile, sent=False)
+
+    def get_drafts(self, profiles: Iterable[Profile]) -> dict[int, Message]:
+        drafts = {
+            profile.pk: Message(profile=profile, sent=False) for profile in profiles
+        }
+        for message in self.filter(profile__in=drafts, sent=False).reverse():
+            drafts[message.profile_id] = message  # type: ignore[attr-defined]
+        return drafts
 
     def filter_unsent(self):
         return self.filter(sent=False).exclude(activity={})
@@ -162,9 +240,14 @@ class Message(models.Model):
             return True
         return None
 
+    def allows(self, friend: bool) -> bool:
+        return len(self) < (8 if friend else 3)
+
     def add(self, voter: Voter, *, save=True):
         self.activity[voter.id] = voter.activity
         if save:
+            if not self.pk:
+                log.debug(f"Drafted new message for {self.profile}")
             self.save()
 
     def clear(self):
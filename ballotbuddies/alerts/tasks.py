@@ -0,0 +1,26 @@
+from django.contrib.auth.models import User
+
+from ballotbuddies.buddies.models import Voter
+from ballotbuddies.core.jobs import task
+
+from . import helpers
+
+
+@task()
+def send_invite_email(user: int, friend: int, debug: bool = False):
+    helpers.send_invite_email(
+        User.objects.get(pk=user), Voter.objects.get(pk=friend), debug=debug
+    )
+
+
+@task()
+def send_invite_emails(users: list[int], friend: int):
+    helpers.send_invite_emails(
+        User.objects.filter(pk__in=users).select_related("voter"),
+        Voter.objects.get(pk=friend),
+    )
+
+
+@task()
+def send_voted_email(user: int):
+    helpers.send_voted_email(User.objects.get(pk=user))
@@ -1 +1,95 @@
-# pylint: disable=expression-not-assigned,singleton-comparison,unused-variable
+# pylint: disable=expression-not-assigned,singleton-comparison,unused-variable,redefined-outer-name
+
+from smtplib import SMTPException
+
+import pytest
+
+from ballotbuddies.alerts import helpers
+from ballotbuddies.alerts.models import Message, Profile
+from ballotbuddies.buddies.constants import REGISTERED
+from ballotbuddies.buddies.models import User, Voter
+
+
+@pytest.fixture
+def profiles():
+    profiles = []
+    for name in ["alice", "bob", "carol"]:
+        user = User.objects.create(
+            username=name, email=f"{name}@example.org", first_name=name, last_name="Doe"
+        )
+        voter = Voter.objects.from_user(user, REGISTERED.status)
+        voter.profile.message.add(voter)
+        profiles.append(voter.profile)
+    Profile.objects.update(will_alert=True)
+    return profiles
+
+
+def describe_update_profiles():
+    @pytest.mark.django_db
+    @pytest.mark.usefixtures("profiles")
+    def it_only_updates_changed_profiles(expect):
+        expect(helpers.update_profiles()) == 3
+        expect(Profile.objects.filter(will_alert=True).count()) == 0
+
+        expect(helpers.update_profiles()) == 0
+
+
+def describe_send_activity_emails():
+    @pytest.mark.django_db
+    @pytest.mark.usefixtures("profiles")
+    def it_sends_batches_over_pooled_connections(expect, mailoutbox):
+        count = helpers.send_activity_emails("", batch_size=2, connections=2)
+
+        expect(count) == 3
+        expect(len(mailoutbox)) == 3
+        expect(Profile.objects.filter(will_alert=True).count()) == 0
+        expect(Message.objects.filter(sent=True).count()) == 3
+
+    @pytest.mark.django_db
+    @pytest.mark.usefixtures("profiles")
+    def it_marks_each_batch_that_was_sent(expect, monkeypatch):
+        def send_messages(emails):
+            if emails[0].to == ["alice@example.org"]:
+                raise SMTPException("Connection unexpectedly closed")
+            return len(emails)
+
+        monkeypatch.setattr(helpers, "send_messages", send_messages)
+
+        count = helpers.send_activity_emails("", batch_size=1, connections=2)
+
+        expect(count) == 3
+        expect(
+            list(
+                Profile.objects.filter(will_alert=True).values_list(
+                    "voter__user__email", flat=True
+                )
+            )
+        ) == ["alice@example.org"]
+        expect(Message.objects.filter(sent=True).count()) == 2
+
+
+def describe_send_invite_emails():
+    @pytest.mark.django_db
+    def it_sends_one_email_per_invited_user(expect, mailoutbox, profiles):
+        friend = profiles[0].voter
+        users = User.objects.exclude(pk=friend.user.pk).select_related("voter")
+
+        count = helpers.send_invite_emails(users, friend)
+
+        expect(count) == 2
+        expect(sorted(email.to[0] for email in mailoutbox)) == [
+            "bob@example.org",
+            "carol@example.org",
+        ]
+
+    @pytest.mark.django_db
+    def it_marks_debug_emails_for_always_alert_profiles(expect, mailoutbox, profiles):
+        Profile.objects.filter(pk=profiles[1].pk).update(always_alert=True)
+        friend = profiles[0].voter
+        users = User.objects.exclude(pk=friend.user.pk).select_related("voter")
+
+        helpers.send_invite_emails(users, friend)
+
+        subjects = {email.to[0]: email.subject for email in mailoutbox}
+        expect(subjects["bob@example.org"]).endswith(" [debug]")
+        expect(subjects["carol@example.org"]).excludes("[debug]")
@@ -38,6 +38,25 @@ def describe_profile():
         expect(profile.has_message) == False
         expect(profile.should_alert) == False
 
+    @pytest.mark.django_db
+    def it_does_not_create_drafts_on_read(expect, profile: Profile):
+        expect(profile.has_message) == False
+
+        profile.mark_viewed()
+        profile.mark_alerted()
+
+        expect(Message.objects.count()) == 0
+
+    @pytest.mark.django_db
+    def it_can_prefetch_drafts(
+        expect, profile: Profile, voter: Voter, django_assert_num_queries
+    ):
+        profile.alert(voter)
+
+        with django_assert_num_queries(2):
+            profiles = list(Profile.objects.with_drafts())
+            expect(len(profiles[0].message)) == 1
+
     @pytest.mark.django_db
     def it_can_update_activity(expect, profile: Profile, voter: Voter):
         profile.alert(voter)
@@ -66,7 +85,41 @@ def describe_profile():
             expect(profile.should_alert) == True
 
 
+def describe_profile_manager():
+    def describe_alert():
+        @pytest.mark.django_db
+        def it_applies_activity_caps(expect, voter: Voter):
+            recipients = [
+                Voter.objects.from_user(User.objects.create(username=name))
+                for name in ["friend", "neighbor", "newbie"]
+            ]
+            for recipient in recipients[:2]:
+                Message.objects.create(
+                    profile=recipient.profile,
+                    activity={str(index): "" for index in range(3)},
+                )
+
+            count = Profile.objects.alert(
+                voter,
+                {
+                    recipients[0].pk: True,
+                    recipients[1].pk: False,
+                    recipients[2].pk: False,
+                },
+            )
+
+            expect(count) == 2
+            expect([len(r.profile.message) for r in recipients]) == [4, 3, 1]
+
+
 def describe_message():
+    def describe_allows():
+        def it_limits_activity_from_neighbors(expect):
+            message = Message(activity={str(index): "" for index in range(3)})
+
+            expect(message.allows(friend=True)) == True
+            expect(message.allows(friend=False)) == False
+
     def describe_str():
         def it_includes_days_to_election(expect, voter):
             message = Message(profile=Profile(voter=voter))
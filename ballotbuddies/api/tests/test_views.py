@@ -1,11 +1,16 @@
 # pylint: disable=expression-not-assigned
 
+import json
 
+from django.db import connection
+from django.test import Client
+from django.test.utils import CaptureQueriesContext
 from django.utils import timezone
 
 import pytest
 from expecter import expect
 
+from ballotbuddies.api import views
 from ballotbuddies.buddies.constants import VOTED
 from ballotbuddies.buddies.models import User, Voter
 
@@ -91,6 +96,126 @@ def describe_provision_voter():
 
             expect(voter.referrer).is_(None)
 
+        @pytest.mark.django_db
+        def it_skips_password_hashing(client, url, voter: Voter):
+            item = provision_data(voter, 1)[0]
+
+            response = client.post(url, item)
+
+            expect(response.status_code) == 200
+            user = User.objects.get(email="test+0@example.com")
+            expect(user.has_usable_password()) == False
+
+
+def provision_data(voter: Voter, count: int) -> list[dict]:
+    return [
+        {
+            "email": f"test+{number}@example.com",
+            "referrer": voter.slug,
+            "first_name": "John",
+            "last_name": f"Doe{number}",
+            "birth_date": "1990-01-01",
+            "zip_code": "12345",
+        }
+        for number in range(count)
+    ]
+
+
+def describe_provision_voters():
+    @pytest.fixture
+    def url():
+        return "/api/provision-voters/"
+
+    @pytest.fixture
+    def client(admin_client):
+        return admin_client
+
+    def describe_POST():
+        @pytest.mark.django_db
+        def it_requires_staff(url):
+            response = Client().post(url, [], content_type="application/json")
+
+            expect(response.status_code) == 403
+
+        @pytest.mark.django_db
+        def it_limits_the_number_of_voters(client, url, voter: Voter, monkeypatch):
+            monkeypatch.setattr(views, "PROVISION_MAX_ITEMS", 2)
+
+            response = client.post(
+                url, provision_data(voter, 3), content_type="application/json"
+            )
+
+            expect(response.status_code) == 400
+            expect(Voter.objects.count()) == 1
+
+        @pytest.mark.django_db
+        def it_creates_voters_from_json(client, url, voter: Voter):
+            response = client.post(
+                url, provision_data(voter, 2), content_type="application/json"
+            )
+
+            expect(response.status_code) == 200
+            expect(response.json()["results"]) == [
+                {"email": "test+0@example.com", "message": "Created voter."},
+                {"email": "test+1@example.com", "message": "Created voter."},
+            ]
+
+            voter2 = Voter.objects.get(user__email="test+1@example.com")
+            expect(voter2.referrer) == voter
+            expect(voter2.user.get_full_name()) == "John Doe1"
+            expect(voter2.state) == "New York"
+            expect(voter2.progress.registered.url) != ""
+            expect(voter2.user.has_usable_password()) == False
+            expect(list(voter.friends.all())).contains(voter2)
+
+        @pytest.mark.django_db
+        def it_accepts_ndjson(client, url, voter: Voter):
+            items = provision_data(voter, 2)
+            items[1]["zip_code"] = "0000"
+            body = "\n".join(json.dumps(item) for item in items)
+
+            response = client.post(url, body, content_type="application/x-ndjson")
+
+            expect(response.status_code) == 200
+            results = response.json()["results"]
+            expect(results[0]["message"]) == "Created voter."
+            expect(results[1]) == {
+                "errors": {"zip_code": ["This value must be exactly five digits."]}
+            }
+
+        @pytest.mark.django_db
+        def it_finds_complete_voters(client, url, complete_voter: Voter):
+            items = provision_data(complete_voter, 1)
+            items[0]["email"] = complete_voter.user.email
+
+            response = client.post(url, items, content_type="application/json")
+
+            expect(response.json()["results"][0]["message"]) == "Found voter."
+
+        @pytest.mark.django_db
+        def it_rejects_objects(client, url):
+            response = client.post(url, {}, content_type="application/json")
+
+            expect(response.status_code) == 400
+
+        @pytest.mark.django_db
+        def it_uses_a_constant_number_of_queries(client, url, voter: Voter):
+            counts = []
+            for count in [10, 100, 500]:
+                data = [
+                    row | {"email": f"{count}.{row['email']}"}
+                    for row in provision_data(voter, count)
+                ]
+
+                with CaptureQueriesContext(connection) as context:
+                    response = client.post(url, data, content_type="application/json")
+
+                expect(response.status_code) == 200
+                counts.append(len(context))
+
+            expect(Voter.objects.count()) == 610 + 1
+            expect(counts) == [counts[0]] * 3
+
 
 def describe_update_ballot():
     @pytest.fixture
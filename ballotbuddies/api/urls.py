@@ -4,6 +4,7 @@ from . import views
 
 urlpatterns = [
     path("provision-voter/", views.provision_voter),
+    path("provision-voters/", views.provision_voters),
     path("update-ballot/", views.update_ballot),
     path("client/", include("rest_framework.urls")),
 ]
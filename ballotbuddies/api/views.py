@@ -1,14 +1,24 @@
+import json
+import time
+from itertools import islice
+
 from django.shortcuts import get_object_or_404
 from django.utils import timezone
 
 import log
 from furl import furl
 from rest_framework import serializers
-from rest_framework.decorators import api_view
+from rest_framework.decorators import api_view, permission_classes, throttle_classes
+from rest_framework.permissions import IsAdminUser
 from rest_framework.response import Response
+from rest_framework.throttling import UserRateThrottle
 
+from ballotbuddies.buddies.geography import is_valid_zip_code
 from ballotbuddies.buddies.models import Voter
 
+PROVISION_BATCH_SIZE = 1000
+PROVISION_MAX_ITEMS = 10_000
+
 
 class VoterSerializer(serializers.Serializer):
     email = serializers.EmailField()
@@ -18,6 +28,12 @@ class VoterSerializer(serializers.Serializer):
     birth_date = serializers.DateField()
     zip_code = serializers.CharField()
 
+    def validate_zip_code(self, value):
+        value = value.strip()
+        if not is_valid_zip_code(value):
+            raise serializers.ValidationError("This value must be exactly five digits.")
+        return value
+
 
 class BallotSerializer(serializers.Serializer):
     voter = serializers.CharField(max_length=100)
@@ -43,7 +59,6 @@ def provision_voter(request):
         message = "Found voter."
     else:
         voter.user.update_name(  # type: ignore
-            request,
             serializer.validated_data["first_name"],
             serializer.validated_data["last_name"],
         )
@@ -55,6 +70,53 @@ def provision_voter(request):
     return Response({"message": message})
 
 
+class ProvisionThrottle(UserRateThrottle):
+    scope = "provision"
+
+
+@api_view(["POST"])
+@permission_classes([IsAdminUser])
+@throttle_classes([ProvisionThrottle])
+def provision_voters(request):
+    try:
+        if request.content_type == "application/x-ndjson":
+            lines = (line for line in request.stream or [] if line.strip())
+            items = [
+                json.loads(line) for line in islice(lines, PROVISION_MAX_ITEMS + 1)
+            ]
+        else:
+            items = request.data
+    except ValueError as e:
+        return Response({"errors": [str(e)]}, 400)
+    if not isinstance(items, list):
+        return Response({"errors": ["Expected a JSON array or NDJSON lines."]}, 400)
+    if len(items) > PROVISION_MAX_ITEMS:
+        message = f"Expected at most {PROVISION_MAX_ITEMS} voters per request."
+        return Response({"errors": [message]}, 400)
+
+    results: list[dict] = []
+    valid: list[tuple[dict, dict]] = []
+    for item in items:
+        serializer = VoterSerializer(data=item)
+        if serializer.is_valid():
+            result = {"email": serializer.validated_data["email"]}
+            valid.append((result, serializer.validated_data))
+        else:
+            result = {"errors": serializer.errors}
+        results.append(result)
+
+    start = time.monotonic()
+    for offset in range(0, len(valid), PROVISION_BATCH_SIZE):
+        batch = valid[offset : offset + PROVISION_BATCH_SIZE]
+        voters = Voter.objects.provision([data for _result, data in batch])
+        for (result, _data), (_voter, complete) in zip(batch, voters):
+            result["message"] = "Found voter." if complete else "Created voter."
+    elapsed = time.monotonic() - start
+    log.info(f"Provisioned {len(valid)} of {len(items)} voter(s) in {elapsed:.1f}s")
+
+    return Response({"results": results})
+
+
 @api_view(["POST"])
 def update_ballot(request):
     serializer = BallotSerializer(data=request.POST)
@@ -74,6 +136,6 @@ def update_ballot(request):
     voter.updated = timezone.now()
     voter.save()
     if previous_ballot is None:
-        voter.share_status()
+        voter.share_status(defer=True)
 
     return Response({"message": "Successfully updated voter's ballot."})
@@ -2,10 +2,12 @@
 
 import json
 
+from django import forms
 from django.contrib import admin, messages
 from django.utils.safestring import mark_safe
 
 from .models import Note, Voter
+from .refresh import refresh_statuses
 
 
 def reset_selected_voters(modeladmin, request, queryset):
@@ -20,12 +22,8 @@ def reset_selected_voters(modeladmin, request, queryset):
 
 
 def update_selected_voters(modeladmin, request, queryset):
-    count = 0
-    voter: Voter
-    for voter in queryset:
-        if voter.update_status(force=True)[0]:
-            voter.save()
-            count += 1
+    stats = refresh_statuses(queryset.select_related("user"), force=True)
+    count = stats.updated
     s = "" if count == 1 else "s"
     messages.info(request, f"Updated {count} voter{s}.")
 
@@ -39,8 +37,22 @@ def share_selected_voters(modeladmin, request, queryset):
     messages.info(request, f"Shared status {count} times{s}.")
 
 
+class VoterAdminForm(forms.ModelForm):
+    class Meta:
+        model = Voter
+        fields = "__all__"
+
+    def clean_friends(self):
+        friends = self.cleaned_data["friends"]
+        if self.instance.pk:
+            friends = friends.exclude(pk=self.instance.pk)
+        return friends
+
+
 @admin.register(Voter)
 class VoterAdmin(admin.ModelAdmin):
+    form = VoterAdminForm
+
     search_fields = [
         "nickname",
         "user__email",
@@ -13,6 +13,11 @@ PREVIEW_HOST = os.getenv("PREVIEW_HOST", "https://share.michiganelections.io")
 BALLOT_PREVIEW_URL = PREVIEW_HOST + "/ballots/{ballot_id}/"
 PRECINCT_PREVIEW_URL = PREVIEW_HOST + "/elections/{election_id}/precincts/{precinct_id}"
 
+REFRESH_WORKERS = int(os.getenv("REFRESH_WORKERS", "8"))
+REFRESH_RATE = float(os.getenv("REFRESH_RATE", "20"))  # requests per second per host
+REFRESH_RETRIES = int(os.getenv("REFRESH_RETRIES", "3"))
+REFRESH_BACKOFF = 0.5  # seconds, doubled after each retry
+
 REGISTRATION_DEADLINE_DELTA = timedelta(days=15)  # common guidance
 ABSENTEE_REQUESTED_DEADLINE_DELTA = timedelta(weeks=4)  # buffer for mail service
 ABSENTEE_RECEIVED_DEADLINE_DELTA = timedelta(weeks=2)  # buffer for mail service
@@ -0,0 +1,57 @@
+from __future__ import annotations
+
+import threading
+import time
+
+import log
+import requests
+
+from . import constants
+
+
+class ElectionCalendar:
+    def __init__(self, *, ttl: float = 60 * 15, retry: float = 60):
+        self.ttl = ttl
+        self.retry = retry
+        self._lock = threading.Lock()
+        self._elections: list[dict] | None = None
+        self._expires = 0.0
+
+    @property
+    def url(self) -> str:
+        return f"{constants.ELECTIONS_HOST}/api/elections/"
+
+    @property
+    def expired(self) -> bool:
+        return time.monotonic() >= self._expires
+
+    def get_elections(self, *, get=requests.get) -> list[dict] | None:
+        with self._lock:
+            if self.expired:
+                self._elections = self._fetch(get)
+                delay = self.ttl if self._elections is not None else self.retry
+                self._expires = time.monotonic() + delay
+            return self._elections
+
+    def invalidate(self):
+        with self._lock:
+            self._elections = None
+            self._expires = 0.0
+
+    def _fetch(self, get) -> list[dict] | None:
+        log.info(f"GET {self.url}")
+        try:
+            response = get(self.url, timeout=10)
+        except requests.RequestException as e:
+            log.error(f"Unable to fetch elections: {e}")
+            return None
+        if response.status_code != 200:
+            log.error(f"{response.status_code} response")
+            return None
+
+        elections = response.json()["results"]
+        log.info(f"200 response: {elections[0] if elections else None}")
+        return elections
+
+
+calendar = ElectionCalendar()
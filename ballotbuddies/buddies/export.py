@@ -0,0 +1,106 @@
+import csv
+import json
+from itertools import islice
+from typing import AsyncIterator, Iterable, Iterator
+
+from django.db.models import QuerySet
+
+from asgiref.sync import sync_to_async
+
+from .models import Voter
+
+COLUMNS = [
+    "id",
+    "first_name",
+    "last_name",
+    "nickname",
+    "email",
+    "state",
+    "zip_code",
+    "election",
+    "election_date",
+    "percent",
+    "actions",
+    "voted",
+    "created",
+]
+
+
+def filter_voters(
+    query: QuerySet[Voter] | None = None,
+    *,
+    state: str = "",
+    election: str = "",
+    complete: bool | None = None,
+) -> QuerySet[Voter]:
+    if query is None:
+        query = Voter.objects.all()
+    if state:
+        query = query.filter(state__iexact=state)
+    if election:
+        query = query.filter(status__election__date=election)
+    if complete is True:
+        query = query.filter(progress_data__percent__gte=100)
+    elif complete is False:
+        query = query.exclude(progress_data__percent__gte=100)
+    return query.order_by("pk")
+
+
+def iter_rows(query: QuerySet[Voter], *, chunk_size: int = 2000) -> Iterator[dict]:
+    """Read progress from stored snapshots, recomputing any that are out of date."""
+    voters = query.select_related("user").iterator(chunk_size=chunk_size)
+    for voter in voters:
+        yield to_row(voter)
+
+
+def to_row(voter: Voter) -> dict:
+    if not voter.progress_current:
+        voter.update_progress()
+    election = (voter.status or {}).get("election", {})
+    progress = voter.progress_data or {}
+    return {
+        "id": voter.pk,
+        "first_name": voter.user.first_name,
+        "last_name": voter.user.last_name,
+        "nickname": voter.nickname,
+        "email": voter.user.email,
+        "state": voter.state,
+        "zip_code": voter.zip_code,
+        "election": election.get("name"),
+        "election_date": election.get("date"),
+        "percent": progress.get("percent"),
+        "actions": progress.get("actions"),
+        "voted": voter.voted,
+        "created": voter.created,
+    }
+
+
+def iter_csv(rows: Iterable[dict]) -> Iterator[str]:
+    buffer = Echo()
+    writer = csv.DictWriter(buffer, fieldnames=COLUMNS)
+    yield writer.writeheader()  # type: ignore[misc]
+    for row in rows:
+        yield writer.writerow(row)
+
+
+def iter_jsonl(rows: Iterable[dict]) -> Iterator[str]:
+    for row in rows:
+        yield json.dumps(row, default=str) + "\n"
+
+
+async def stream(lines: Iterator[str], *, size: int = 500) -> AsyncIterator[str]:
+    """Consume a synchronous export in chunks so ASGI never buffers it all."""
+    read = sync_to_async(lambda: "".join(islice(lines, size)))
+    while chunk := await read():
+        yield chunk
+
+
+FORMATS = {
+    "csv": ("text/csv", iter_csv),
+    "jsonl": ("application/x-ndjson", iter_jsonl),
+}
+
+
+class Echo:
+    def write(self, value: str) -> str:
+        return value
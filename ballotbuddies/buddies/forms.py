@@ -2,6 +2,7 @@ from django import forms
 
 from multi_email_field.forms import MultiEmailField
 
+from .geography import is_valid_zip_code
 from .models import Voter
 from .widgets import DateInput
 
@@ -47,7 +48,7 @@ class VoterForm(forms.ModelForm):
 
     def clean_zip_code(self):
         value = self.cleaned_data["zip_code"].strip()
-        if len(value) != 5 or not value.isnumeric():
+        if not is_valid_zip_code(value):
             raise forms.ValidationError("This value must be exactly five digits.")
         return value
 
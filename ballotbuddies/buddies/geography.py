@@ -0,0 +1,34 @@
+import json
+import zlib
+from functools import cache
+from pathlib import Path
+
+ZIP_STATES = Path(__file__).parent / "data" / "zip_states.bin"
+
+
+def build_zip_states(places: list[tuple[str, str]]) -> bytes:
+    """Encode (ZIP code, state name) pairs as one byte per possible ZIP code."""
+    states = sorted({state for _zip_code, state in places})
+    table = bytearray(100_000)
+    for zip_code, state in places:
+        table[int(zip_code)] = states.index(state) + 1
+    header = json.dumps(states).encode()
+    return zlib.compress(header + b"\n" + table, 9)
+
+
+@cache
+def load_zip_states(path: Path = ZIP_STATES) -> tuple[list[str], bytes]:
+    header, table = zlib.decompress(path.read_bytes()).split(b"\n", 1)
+    return [""] + json.loads(header), table
+
+
+def get_state(zip_code: str | None) -> str:
+    if not zip_code or not is_valid_zip_code(zip_code):
+        return ""
+    states, table = load_zip_states()
+    return states[table[int(zip_code)]]
+
+
+def is_valid_zip_code(zip_code: str) -> bool:
+    """Check the format only: new ZIP codes may be missing from the table."""
+    return len(zip_code) == 5 and zip_code.isdigit()
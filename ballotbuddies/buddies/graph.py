@@ -0,0 +1,201 @@
+from __future__ import annotations
+
+import threading
+from array import array
+from bisect import bisect_left
+from collections import defaultdict
+from contextlib import contextmanager
+from dataclasses import dataclass, field
+from typing import Iterable, Iterator, Mapping, NamedTuple
+
+from django.apps import apps
+from django.db.models import Q, QuerySet
+
+import log
+
+EMPTY: frozenset[int] = frozenset()
+
+
+class Relation(Mapping[int, frozenset[int]]):
+    """Directed voter edges in compressed sparse rows plus a small overlay."""
+
+    def __init__(self, pairs: Iterable[tuple[int, int]] = ()):
+        self._sources = array("q")
+        self._offsets = array("q", [0])
+        self._targets = array("q")
+        for source, target in sorted(set(pairs)):
+            if not self._sources or self._sources[-1] != source:
+                if self._sources:
+                    self._offsets.append(len(self._targets))
+                self._sources.append(source)
+            self._targets.append(target)
+        if self._sources:
+            self._offsets.append(len(self._targets))
+        self._added: dict[int, set[int]] = defaultdict(set)
+        self._removed: dict[int, set[int]] = defaultdict(set)
+        self._reverse: Relation | None = None
+
+    def __getitem__(self, source: int) -> frozenset[int]:
+        targets = frozenset(self._row(source))
+        if source in self._added or source in self._removed:
+            targets = (targets | self._added.get(source, EMPTY)) - self._removed.get(
+                source, EMPTY
+            )
+        if not targets:
+            raise KeyError(source)
+        return targets
+
+    def __iter__(self) -> Iterator[int]:
+        for source in self._sources:
+            if source not in self._removed or source in self:
+                yield source
+        for source in self._added:
+            if self._added[source] and not self._row(source):
+                yield source
+
+    def __len__(self) -> int:
+        return sum(1 for _ in self)
+
+    @property
+    def reverse(self) -> Relation:
+        if self._reverse is None:
+            self._reverse = Relation(
+                (target, source) for source, target in self.edges()
+            )
+        return self._reverse
+
+    def edges(self) -> Iterator[tuple[int, int]]:
+        for source in self:
+            for target in self[source]:
+                yield source, target
+
+    def has(self, source: int, target: int) -> bool:
+        if target in self._removed.get(source, EMPTY):
+            return False
+        if target in self._added.get(source, EMPTY):
+            return True
+        row = self._row(source)
+        position = bisect_left(row, target)
+        return position < len(row) and row[position] == target
+
+    def degree(self, source: int) -> int:
+        return len(self.get(source, EMPTY))
+
+    def add(self, source: int, *targets: int):
+        for target in targets:
+            self._removed[source].discard(target)
+            self._added[source].add(target)
+        if self._reverse is not None:
+            for target in targets:
+                self._reverse.add(target, source)
+
+    def remove(self, source: int, *targets: int):
+        for target in targets:
+            self._added[source].discard(target)
+            self._removed[source].add(target)
+        if self._reverse is not None:
+            for target in targets:
+                self._reverse.remove(target, source)
+
+    def _row(self, source: int) -> array:
+        position = bisect_left(self._sources, source)
+        if position < len(self._sources) and self._sources[position] == source:
+            start, end = self._offsets[position], self._offsets[position + 1]
+            return self._targets[start:end]
+        return array("q")
+
+
+class Degree(NamedTuple):
+    friends: int
+    followers: int
+    neighbors: int
+    strangers: int
+
+
+@dataclass
+class SocialGraph:
+    friends: Relation = field(default_factory=Relation)
+    neighbors: Relation = field(default_factory=Relation)
+    strangers: Relation = field(default_factory=Relation)
+
+    @classmethod
+    def load(cls, voters: QuerySet | None = None) -> SocialGraph:
+        Voter = apps.get_model("buddies", "Voter")
+        owned = reachable = Q()
+        if voters is not None:
+            owned = Q(from_voter__in=voters.values("pk"))
+            direct = Voter.friends.through.objects.filter(owned)
+            reachable = owned | Q(from_voter__in=direct.values("to_voter_id"))
+        graph = cls(
+            friends=Relation(_load_edges(Voter.friends.through, reachable)),
+            neighbors=Relation(_load_edges(Voter.neighbors.through, owned)),
+            strangers=Relation(_load_edges(Voter.strangers.through, owned)),
+        )
+        log.info(f"Loaded social graph: {graph}")
+        return graph
+
+    def __str__(self):
+        return (
+            f"{len(self.friends)} voter(s) with friends, "
+            f"{len(self.neighbors)} with recommendations, "
+            f"{len(self.strangers)} with unfollows"
+        )
+
+    def followers(self, voter: int) -> frozenset[int]:
+        return self.friends.reverse.get(voter, EMPTY)
+
+    def mutuals(self, voter: int) -> frozenset[int]:
+        return self.friends.get(voter, EMPTY) & self.followers(voter)
+
+    def degree(self, voter: int) -> Degree:
+        return Degree(
+            self.friends.degree(voter),
+            self.friends.reverse.degree(voter),
+            self.neighbors.degree(voter),
+            self.strangers.degree(voter),
+        )
+
+    def reachable(self, voter: int, *, hops: int = 2) -> set[int]:
+        seen = {voter}
+        frontier = {voter}
+        for _ in range(hops):
+            frontier = {
+                target
+                for source in frontier
+                for target in self.friends.get(source, EMPTY)
+                if target not in seen
+            }
+            seen |= frontier
+        seen.discard(voter)
+        return seen
+
+
+class Index(threading.local):
+    graph: SocialGraph | None = None
+
+    @contextmanager
+    def load(self, voters: QuerySet | None = None) -> Iterator[SocialGraph]:
+        previous = self.graph
+        self.graph = SocialGraph.load(voters)
+        try:
+            yield self.graph
+        finally:
+            self.graph = previous
+
+    def link(self, relation: str, source: int, *targets: int):
+        if self.graph is not None:
+            getattr(self.graph, relation).add(source, *targets)
+
+    def unlink(self, relation: str, source: int, *targets: int):
+        if self.graph is not None:
+            getattr(self.graph, relation).remove(source, *targets)
+
+
+def _load_edges(model, condition: Q) -> Iterator[tuple[int, int]]:
+    query = model.objects.filter(condition)
+    yield from query.values_list("from_voter_id", "to_voter_id").iterator(
+        chunk_size=5000
+    )
+
+
+index = Index()
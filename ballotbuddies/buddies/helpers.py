@@ -6,8 +6,10 @@ from django.utils import timezone
 
 import log
 
+from . import recommend
 from .constants import SAMPLE_DATA
 from .models import User, Voter
+from .refresh import refresh_statuses, save_voters
 from .types import Progress
 
 
@@ -27,18 +29,9 @@ def generate_sample_voters(referrer: str = ""):
 
 
 def update_neighbors() -> int:
-    total = 0
-
     query = Voter.objects.annotate(pending=Count("neighbors")).filter(pending__lt=3)
     log.info(f"Updating neighbors for {query.count()} voter(s)")
-    voter: Voter
-    for voter in query:
-        if count := voter.update_neighbors(limit=3):
-            log.info(f"Recommended {count} friend(s) to {voter}")
-            voter.save()
-            total += 1
-
-    return total
+    return len(recommend.update_neighbors(query, limit=3))
 
 
 def update_statuses() -> int:
@@ -47,13 +40,39 @@ def update_statuses() -> int:
     age = timezone.now() - timedelta(days=1, hours=1)
     query = Voter.objects.filter(Q(fetched__lte=age) | Q(fetched=None))
     log.info(f"Updating status for {query.count()} voter(s)")
+
+    cleared = []
     voter: Voter
-    for voter in query:
+    for voter in query.filter(voted__isnull=False):
         if clear_past_election(voter):
+            voter.save()
+            cleared.append(voter.id)
             total += 1
-        elif voter.update_status()[0]:
+
+    voters = query.exclude(id__in=cleared).select_related("user")
+    stats = refresh_statuses(voters.iterator(chunk_size=500))
+    total += stats.updated
+
+    return total
+
+
+def update_rankings() -> int:
+    total = 0
+
+    query = Voter.objects.select_related("user")
+    log.info(f"Updating rankings for {query.count()} voter(s)")
+
+    batch: list[Voter] = []
+    voter: Voter
+    for voter in query.iterator(chunk_size=500):
+        voter.update_progress()
+        voter.update_sort_name()
+        if voter.changed_fields:
+            batch.append(voter)
             total += 1
-        voter.save()
+        if len(batch) >= 500:
+            save_voters(batch)
+    save_voters(batch)
 
     return total
 
@@ -0,0 +1,17 @@
+# Generated by Django 5.0.14 on 2026-10-18 19:19
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("buddies", "0024_note"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="voter",
+            name="progress_data",
+            field=models.JSONField(blank=True, editable=False, null=True),
+        ),
+    ]
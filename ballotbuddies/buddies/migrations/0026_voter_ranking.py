@@ -0,0 +1,25 @@
+# Generated by Django 5.0.14 on 2026-10-18 19:21
+
+import django.contrib.postgres.fields
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("buddies", "0025_voter_progress_data"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="voter",
+            name="progress_rank",
+            field=django.contrib.postgres.fields.ArrayField(
+                base_field=models.FloatField(), default=list, editable=False, size=None
+            ),
+        ),
+        migrations.AddField(
+            model_name="voter",
+            name="sort_name",
+            field=models.CharField(default="", editable=False, max_length=300),
+        ),
+    ]
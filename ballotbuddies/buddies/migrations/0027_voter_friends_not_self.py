@@ -0,0 +1,25 @@
+from django.db import migrations
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("buddies", "0026_voter_ranking"),
+    ]
+
+    # The friends table is auto-created by the ManyToManyField, so the model
+    # state cannot declare this constraint; VoterManager._link_friends and
+    # Voter.add_friend skip self-links before they reach the database.
+    operations = [
+        migrations.RunSQL(
+            sql=[
+                "DELETE FROM buddies_voter_friends WHERE from_voter_id = to_voter_id;",
+                "ALTER TABLE buddies_voter_friends "
+                "ADD CONSTRAINT buddies_voter_friends_not_self "
+                "CHECK (from_voter_id <> to_voter_id);",
+            ],
+            reverse_sql=(
+                "ALTER TABLE buddies_voter_friends "
+                "DROP CONSTRAINT buddies_voter_friends_not_self;"
+            ),
+        ),
+    ]
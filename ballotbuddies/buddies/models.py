@@ -1,40 +1,70 @@
 from __future__ import annotations
 
-from contextlib import suppress
+import hashlib
+import json
 from copy import deepcopy
 from datetime import timedelta
 from functools import cached_property
-from itertools import chain
-from typing import Iterator
+from typing import Iterable, Iterator
 from urllib.parse import urlencode
 
+from django.contrib.auth.hashers import make_password
 from django.contrib.auth.models import User
-from django.db import models
+from django.contrib.postgres.fields import ArrayField
+from django.db import models, transaction
+from django.db.models import Count, Q
 from django.utils import timezone
 
 import log
 import requests
-import us
-import zipcodes
 from furl import furl
 
-from ballotbuddies.alerts.helpers import send_invite_email, send_voted_email
+from ballotbuddies.alerts.models import Profile
 from ballotbuddies.core.helpers import generate_key
+from ballotbuddies.core.jobs import enqueue
 
 from . import constants
+from .elections import calendar
+from .geography import get_state
+from .graph import EMPTY, index
+from .recommend import update_neighbors
 from .types import Message, Progress, to_date
 
 ZERO_WIDTH_SPACE = "\u200b"
 
-
-class VoterManager(models.Manager):
+RANKING = ["-progress_rank", "sort_name"]
+
+PROVISIONED_FIELDS = [
+    "birth_date",
+    "zip_code",
+    "state",
+    "progress_data",
+    "progress_rank",
+    "sort_name",
+]
+
+DERIVED_PROPERTIES = [
+    "data",
+    "status_api",
+    "complete",
+    "election",
+    "ballot_url",
+    "ballot_edit_url",
+    "ballot_view_url",
+    "ballot_share_url",
+    "ballot_items",
+]
+
+
+class VoterManager(models.Manager["Voter"]):
     def from_email(self, email: str, referrer: str, *, create=True) -> Voter:
         if not create:
             return self.get(user__email=email.lower())  # type: ignore
 
         try:
             user, created = User.objects.get_or_create(
-                email=email.lower(), defaults=dict(username=email)
+                email=email.lower(),
+                defaults=dict(username=email, password=make_password(None)),
             )
             if created:
                 log.info(f"Created user: {user}")
@@ -46,6 +76,132 @@ class VoterManager(models.Manager):
         voter.add_friend(referrer)
         return voter
 
+    def provision(self, rows: list[dict]) -> list[tuple[Voter, bool]]:
+        """Find or create voters for validated provisioning data in bulk.
+
+        Returns each row's voter and whether it was found already complete.
+        """
+        with transaction.atomic():
+            voters = self._provision_voters(rows)
+            self._provision_referrers(rows, voters)
+        return voters
+
+    def _provision_voters(self, rows: list[dict]) -> list[tuple[Voter, bool]]:
+        emails = [row["email"].lower() for row in rows]
+        users = self._get_or_create_users(emails)
+        voters, created_voters = self._get_or_build_voters(users.values())
+        loaded = set(voters) - {voter.user.pk for voter in created_voters}
+
+        results = []
+        updated: dict[int, Voter] = {}
+        for email, row in zip(emails, rows):
+            voter = voters[users[email].pk]
+            complete = voter.complete
+            if not complete:
+                user = voter.user
+                user.first_name = row["first_name"]
+                user.last_name = row["last_name"]
+                if not user.is_superuser:
+                    user.username = f"{user.get_full_name()} ({user.email})"
+                if user.get_full_name().islower():
+                    user.first_name = user.first_name.capitalize()
+                    user.last_name = user.last_name.capitalize()
+                voter.birth_date = row["birth_date"]
+                voter.zip_code = row["zip_code"]
+                voter.state = get_state(voter.zip_code) or voter.state
+                voter.update_progress()
+                voter.update_sort_name()
+                updated[user.pk] = voter
+            results.append((voter, complete))
+
+        self.bulk_create(created_voters)
+        log.info(f"Created {len(created_voters)} voter(s)")
+        existing = [voter for pk, voter in updated.items() if pk in loaded]
+        self.bulk_update(existing, PROVISIONED_FIELDS, batch_size=1000)
+        User.objects.bulk_update(
+            [voter.user for voter in updated.values()],
+            ["first_name", "last_name", "username"],
+            batch_size=1000,
+        )
+        return results
+
+    def _get_or_create_users(self, emails: list[str]) -> dict[str, User]:
+        users: dict[str, User] = {}
+        for user in User.objects.filter(email__in=emails).order_by("pk"):
+            users.setdefault(user.email, user)
+        created = [
+            User(email=email, username=email, password=make_password(None))
+            for email in dict.fromkeys(emails)
+            if email not in users
+        ]
+        User.objects.bulk_create(created)
+        users.update((user.email, user) for user in created)
+        log.info(f"Created {len(created)} user(s)")
+        return users
+
+    def _get_or_build_voters(
+        self, users: Iterable[User]
+    ) -> tuple[dict[int, Voter], list[Voter]]:
+        """Map users to voters, returning the voters that still need saving."""
+        users = list(users)
+        voters: dict[int, Voter] = {
+            voter.user_id: voter  # type: ignore[attr-defined]
+            for voter in self.filter(user__in=users).select_related("user")
+        }
+        created = []
+        for user in users:
+            if user.pk not in voters:
+                voters[user.pk] = voter = self.model(user=user)
+                created.append(voter)
+        return voters, created
+
+    def _link_friends(self, pairs: list[tuple[int, int]]):
+        pairs = [(source, target) for source, target in pairs if source != target]
+        Friend = self.model.friends.through
+        Friend.objects.bulk_create(
+            [
+                Friend(from_voter_id=source, to_voter_id=target)
+                for source, target in pairs
+            ],
+            batch_size=5000,
+            ignore_conflicts=True,
+        )
+        for source, target in pairs:
+            index.link("friends", source, target)
+
+    def _provision_referrers(self, rows: list[dict], voters: list[tuple[Voter, bool]]):
+        batch = {voter.pk: voter for voter, _complete in voters}
+        referrers = {
+            voter.slug: batch.get(voter.pk, voter)
+            for voter in self.filter(slug__in={row["referrer"] for row in rows})
+        }
+        Friend = self.model.friends.through
+        existing = set(
+            Friend.objects.filter(
+                from_voter__in=list(batch),
+                to_voter__in=referrers.values(),
+            ).values_list("from_voter_id", "to_voter_id")
+        )
+
+        changed: dict[int, Voter] = {}
+        friendships = []
+        for row, (voter, _complete) in zip(rows, voters):
+            referrer = referrers.get(row["referrer"])
+            if referrer is None or referrer == voter:
+                continue
+            if (voter.pk, referrer.pk) in existing:
+                continue
+            existing.add((voter.pk, referrer.pk))
+            log.info(f"Creating friendship: {voter} + {referrer}")
+            voter.referrer_id = voter.referrer_id or referrer.pk  # type: ignore
+            referrer.referrer_id = referrer.referrer_id or voter.pk  # type: ignore
+            changed.update({voter.pk: voter, referrer.pk: referrer})
+            friendships.append((voter.pk, referrer.pk))
+            friendships.append((referrer.pk, voter.pk))
+
+        self._link_friends(friendships)
+        self.bulk_update(changed.values(), ["referrer"], batch_size=1000)
+
     def from_user(self, user: User, status: dict | None = None) -> Voter:
         voter: Voter
         voter, created = self.get_or_create(user=user)  # type: ignore
@@ -59,25 +215,48 @@ class VoterManager(models.Manager):
     def from_slug(self, referrer: str) -> Voter | None:
         return self.filter(slug=referrer).first()  # type: ignore
 
+    def complete(self):
+        return (
+            self.exclude(user__first_name="")
+            .exclude(user__last_name="")
+            .exclude(birth_date=None)
+            .exclude(zip_code=None)
+            .exclude(zip_code="")
+        )
+
     def invite(self, voter: Voter, emails: list[str]) -> list[Voter]:
-        friends = []
-        for email in emails:
-            user, created = User.objects.get_or_create(
-                email=email.lower(), defaults=dict(username=email)
+        own = voter.user.email.lower()
+        emails = [e for e in dict.fromkeys(e.lower() for e in emails) if e != own]
+        if not emails:
+            return []
+
+        with transaction.atomic():
+            users = self._get_or_create_users(emails)
+            voters, created = self._get_or_build_voters(users.values())
+            for other in created:
+                other.update_progress()
+                other.update_sort_name()
+            self.bulk_create(created)
+            log.info(f"Created {len(created)} voter(s)")
+
+            friends = [voters[users[email].pk] for email in emails]
+            referred = [other for other in friends if not other.referrer_id]  # type: ignore
+            for other in referred:
+                other.referrer = voter
+            self.bulk_update(referred, ["referrer"])
+            self._link_friends(
+                [(other.pk, voter.pk) for other in friends]
+                + [(voter.pk, other.pk) for other in friends]
             )
-            if created:
-                log.info(f"Created user: {user}")
-                self.get_or_create(user=user)
-            debug = hasattr(user, "profile") and user.profile.always_alert  # type: ignore
-            send_invite_email(user, voter, debug=debug)
-
-            other = self.from_user(user)
-            other.referrer = other.referrer or voter
-            other.friends.add(voter)
-            other.save()
 
-            voter.friends.add(other)
-            friends.append(other)
+        pks = sorted(user.pk for user in users.values())
+        digest = hashlib.md5(json.dumps(pks).encode()).hexdigest()
+        enqueue(
+            "alerts.send_invite_emails",
+            key=f"invite:{voter.pk}:{digest}",
+            users=pks,
+            friend=voter.pk,
+        )
 
         voter.save()
         return friends
@@ -96,6 +275,9 @@ class Voter(models.Model):
     state = models.CharField(max_length=20, default="", editable=False)
 
     status = models.JSONField(null=True, blank=True, editable=False)
+    progress_data = models.JSONField(null=True, blank=True, editable=False)
+    progress_rank = ArrayField(models.FloatField(), default=list, editable=False)
+    sort_name = models.CharField(max_length=300, default="", editable=False)
     absentee = models.BooleanField(
         default=True, help_text="Voter plans to vote by mail."
     )
@@ -156,9 +338,9 @@ class Voter(models.Model):
         return f"{self.user.get_full_name()} <{self.user.email}>"
 
     def __lt__(self, other: Voter):
-        if self.progress == other.progress:
+        if self.progress_values == other.progress_values:
             return self.display_name.lower() < other.display_name.lower()
-        return self.progress > other.progress
+        return self.progress_values > other.progress_values
 
     @cached_property
     def legal_name(self) -> str:
@@ -187,12 +369,15 @@ class Voter(models.Model):
 
     @cached_property
     def friends_cta(self) -> str:
-        friends = self.friends.count()
-        neighbors = self.neighbors.count()
-        voters = (
-            self.friends.exclude(voted__isnull=True).count()
-            + self.neighbors.exclude(voted__isnull=True).count()
-        )
+        counts = {
+            relation: getattr(self, relation).aggregate(
+                total=Count("pk"), voted=Count("pk", filter=Q(voted__isnull=False))
+            )
+            for relation in ["friends", "neighbors"]
+        }
+        friends = counts["friends"]["total"]
+        neighbors = counts["neighbors"]["total"]
+        voters = counts["friends"]["voted"] + counts["neighbors"]["voted"]
 
         s = "" if friends == 1 else "s"
         text = f"You follow {friends} voter{s}"
@@ -251,10 +436,6 @@ class Voter(models.Model):
             zip_code=self.zip_code,
         )
 
-    @cached_property
-    def elections_api(self) -> str:
-        return f"{constants.ELECTIONS_HOST}/api/elections/"
-
     @cached_property
     def status_api(self) -> str:
         data = self.data.copy()
@@ -312,6 +493,95 @@ class Voter(models.Model):
 
     @cached_property
     def progress(self) -> Progress:
+        if self.progress_current:
+            return Progress.from_snapshot(self.progress_data)  # type: ignore
+        progress = self._parse_progress()
+        if self._infer_progress(progress):
+            self.save()
+        return self._finish_progress(progress)
+
+    @property
+    def progress_key(self) -> str:
+        values = [
+            constants.today(),
+            self.status,
+            self.state,
+            self.complete,
+            self.absentee,
+            self.ballot_updated,
+            self.ballot_shared,
+            self.ballot_returned,
+            self.voted,
+        ]
+        data = json.dumps(values, sort_keys=True, default=str)
+        return hashlib.md5(data.encode()).hexdigest()
+
+    @property
+    def row_key(self) -> str:
+        values = [
+            self.progress_key,
+            self.slug,
+            self.token,
+            self.nickname,
+            self.user.first_name,
+            self.user.last_name,
+            self.user.email,
+            self.birth_date,
+            self.zip_code,
+            self.ballot,
+        ]
+        data = json.dumps(values, default=str)
+        return hashlib.md5(data.encode()).hexdigest()
+
+    @property
+    def row_timeout(self) -> int:
+        return 60 * 60 * 24 if self.pk else 0
+
+    @property
+    def progress_current(self) -> bool:
+        if self.progress_data:
+            return self.progress_data.get("key") == self.progress_key
+        return False
+
+    @property
+    def progress_values(self) -> tuple:
+        if self.progress_current:
+            return tuple(self.progress_data["values"])  # type: ignore
+        return self.progress.values
+
+    def update_progress(self):
+        for name in DERIVED_PROPERTIES:
+            self.__dict__.pop(name, None)
+        if self.progress_current:
+            return
+        progress = self._parse_progress()
+        if self._infer_progress(progress):
+            progress = self._parse_progress()
+        progress = self._finish_progress(progress)
+        self.progress_data = progress.snapshot | {"key": self.progress_key}
+        self.progress_rank = list(progress.values)
+        self.__dict__.pop("progress", None)
+        self.__dict__["_progress_updated"] = True
+
+    def update_sort_name(self):
+        self.__dict__.pop("legal_name", None)
+        self.__dict__.pop("display_name", None)
+        self.sort_name = self.display_name.lower()
+
+    def notify_progress(self, *, refresh=True) -> bool:
+        updated = self.__dict__.pop("_progress_updated", False)
+        if updated and refresh:
+            Profile.objects.refresh(Profile.objects.filter(voter=self))
+        if self.__dict__.pop("_voted_recorded", False):
+            if self.user.pk and not self.profile.never_alert:
+                enqueue(
+                    "alerts.send_voted_email",
+                    key=f"voted:{self.user.pk}",
+                    user=self.user.pk,
+                )
+        return updated
+
+    def _parse_progress(self) -> Progress:
         progress = Progress.parse(
             self.status,
             completed_date=self.ballot_updated,
@@ -337,25 +607,31 @@ class Voter(models.Model):
             progress.absentee_requested.url = ""
             progress.absentee_received.disable()
 
+        return progress
+
+    def _finish_progress(self, progress: Progress) -> Progress:
+        if not self.voted and progress.election.date:
+            if progress.ballot_completed and not progress.ballot_sent:
+                progress.voted.icon = "🟡"
+            if progress.ballot_available and progress.election.days <= 0:
+                progress.voted.icon = "🟡"
+        return progress
+
+    def _infer_progress(self, progress: Progress) -> bool:
+        changed = False
+
         if progress.ballot_received.date and not self.ballot_returned:
             log.info(f"Inferring ballot was returned: {self}")
             self.ballot_returned = progress.ballot_received.date_comparable
-            self.save()
+            changed = True
 
         if progress.voted.date and not self.voted:
             log.info(f"Recording vote for current election: {self}")
             self.voted = progress.voted.date_comparable
-            self.save()
-            if self.user.pk and not self.profile.never_alert:
-                send_voted_email(self.user)
+            self.__dict__["_voted_recorded"] = True
+            changed = True
 
-        if not self.voted and progress.election.date:
-            if progress.ballot_completed and not progress.ballot_sent:
-                progress.voted.icon = "🟡"
-            if progress.ballot_available and progress.election.days <= 0:
-                progress.voted.icon = "🟡"
-
-        return progress
+        return changed
 
     @cached_property
     def activity(self) -> str:
@@ -382,13 +658,15 @@ class Voter(models.Model):
         return f"{self.display_name} {action}"
 
     @cached_property
-    def community(self) -> list[Voter]:
-        return sorted(
-            chain(
-                [self],
-                self.friends.select_related("user"),
-                self.neighbors.select_related("user"),
+    def community(self) -> models.QuerySet[Voter]:
+        return (
+            Voter.objects.filter(
+                Q(pk=self.pk)
+                | Q(pk__in=self.friends.values("pk"))
+                | Q(pk__in=self.neighbors.values("pk"))
             )
+            .select_related("user")
+            .order_by(*RANKING)
         )
 
     def reset_status(self, *, absentee=None, ballot=None, status=None, promoter=None):
@@ -408,8 +686,18 @@ class Voter(models.Model):
         Note.objects.reset(self)
 
     def update_status(self, *, force: bool = False) -> tuple[bool, str]:
+        skip, message = self.check_status(force=force)
+        if skip:
+            return False, message
+
+        log.info(f"GET {self.status_api}")
+        response = requests.get(self.status_api, timeout=10)
+        return self.record_status(response, message)
+
+    def check_status(
+        self, *, force: bool = False, get=requests.get
+    ) -> tuple[bool, str]:
         message = ""
-        previous_fingerprint = self.fingerprint
 
         if self.state != "Michigan":
             self.updated = timezone.now()
@@ -419,25 +707,24 @@ class Voter(models.Model):
         elif self.user.is_test:  # type: ignore
             message = "Voter registration can only be fetched for real people."
         else:
-            log.info(f"GET {self.elections_api}")
-            response = requests.get(self.elections_api, timeout=10)
-            if response.status_code == 200:
-                data = response.json()
-                election = data["results"][0]
-                log.info(f"200 response: {election}")
-                date = to_date(election["date"])
-                if date < constants.today():
-                    message = "There are no upcoming elections at this time."
-            else:
+            elections = calendar.get_elections(get=get)
+            if elections is None:
                 message = "Election information unavailable at this time."
+            elif not elections or to_date(elections[0]["date"]) < constants.today():
+                message = "There are no upcoming elections at this time."
 
         if message:
             log.info(message.strip(".") + f": {self}")
             if self.updated is not None and not force:
-                return False, message
+                return True, message
+
+        return False, message
+
+    def record_status(
+        self, response: requests.Response, message: str = "", *, share: bool = True
+    ) -> tuple[bool, str]:
+        previous_fingerprint = self.fingerprint
 
-        log.info(f"GET {self.status_api}")
-        response = requests.get(self.status_api, timeout=10)
         if response.status_code == 202:
             data = response.json()
             log.error(f"{response.status_code} response: {data}")
@@ -455,8 +742,10 @@ class Voter(models.Model):
         changed = self.fingerprint != previous_fingerprint
         if changed or not self.updated:
             self.updated = timezone.now()
-            if previous_fingerprint:
+            if previous_fingerprint and share:
                 self.share_status()
+            elif previous_fingerprint:
+                self.__dict__["_share_pending"] = True
 
         return changed, message
 
@@ -469,16 +758,27 @@ class Voter(models.Model):
         delta = timezone.now() - self.updated if self.updated else timedelta(days=1)
         return delta.total_seconds()
 
-    def share_status(self) -> int:
-        count = 0
-        voter: Voter
-        for voter in self.friends.select_related("profile"):
-            if voter.profile.alert(self):
-                count += 1
-        for voter in self.neighbors.select_related("profile"):
-            if voter.profile.alert(self, voter.friends.filter(pk=self.pk).exists()):
-                count += 1
-        return count
+    def share_status(self, *, defer=False) -> int:
+        if defer:
+            enqueue(
+                "buddies.share_status", key=f"share_status:{self.pk}", voter=self.pk
+            )
+            return 0
+        if (graph := index.graph) is not None:
+            friends = set(graph.friends.get(self.pk, EMPTY))
+            neighbors = set(graph.neighbors.get(self.pk, EMPTY)) - friends
+            followers = {pk for pk in neighbors if graph.friends.has(pk, self.pk)}
+        else:
+            friends = set(self.friends.values_list("pk", flat=True))
+            neighbors = set(self.neighbors.values_list("pk", flat=True)) - friends
+            followers = set(
+                Voter.friends.through.objects.filter(
+                    from_voter__in=neighbors, to_voter=self
+                ).values_list("from_voter_id", flat=True)
+            )
+        recipients = {pk: pk in followers for pk in neighbors}
+        recipients.update(dict.fromkeys(friends, True))
+        return Profile.objects.alert(self, recipients)
 
     def add_friend(self, referrer: str) -> tuple[Voter | None, bool]:
         voter = Voter.objects.from_slug(referrer)
@@ -490,30 +790,17 @@ class Voter(models.Model):
         log.info(f"Creating friendship: {self} + {voter}")
         self.referrer = self.referrer or voter
         self.friends.add(voter)
+        index.link("friends", self.pk, voter.pk)
         self.save()
         voter.referrer = voter.referrer or self
         voter.friends.add(self)
+        index.link("friends", voter.pk, self.pk)
         voter.save()
         return voter, True
 
     def update_neighbors(self, *, limit=0) -> int:
-        added = 0
-        for friend in self.friends.all():
-            for voter in friend.friends.all():
-                if not any(
-                    (
-                        voter == self,
-                        not voter.complete,
-                        self.friends.filter(pk=voter.pk).exists(),
-                        self.neighbors.filter(pk=voter.pk).exists(),
-                        self.strangers.filter(pk=voter.pk).exists(),
-                    )
-                ):
-                    self.neighbors.add(voter)
-                    added += 1
-                    if limit and added >= limit:
-                        return added
-        return added
+        voters = Voter.objects.filter(pk=self.pk)
+        return len(update_neighbors(voters, limit=limit).get(self.pk, []))
 
     @property
     def updated_humanized(self) -> str:
@@ -526,20 +813,74 @@ class Voter(models.Model):
             return f"{self.updated:%-m/%-d}"
         return "−"
 
+    @classmethod
+    def from_db(cls, db, field_names, values):
+        voter = super().from_db(db, field_names, values)
+        voter.track_changes()
+        return voter
+
+    def refresh_from_db(self, *args, **kwargs):
+        super().refresh_from_db(*args, **kwargs)
+        self.track_changes(kwargs.get("fields"))
+
+    def track_changes(self, fields: Iterable[str] | None = None):
+        loaded = self.__dict__.setdefault("_loaded", {})
+        attnames = {field.name: field.attname for field in self._meta.fields}
+        names = self._tracked_fields if fields is None else fields
+        for name in names:
+            name = attnames.get(name, name)
+            if name in self.__dict__:
+                loaded[name] = self._snapshot(self.__dict__[name])
+
+    @property
+    def changed_fields(self) -> list[str] | None:
+        loaded = self.__dict__.get("_loaded")
+        if loaded is None:
+            return None
+        return [
+            name
+            for name in self._tracked_fields
+            if name in self.__dict__
+            and (
+                name not in loaded
+                or loaded[name] != self._snapshot(self.__dict__[name])
+            )
+        ]
+
+    @staticmethod
+    def _snapshot(value):
+        if isinstance(value, (dict, list)):
+            data = json.dumps(value, sort_keys=True, default=str)
+            return hashlib.md5(data.encode()).hexdigest()
+        return value
+
+    @property
+    def _tracked_fields(self) -> list[str]:
+        return [field.attname for field in self._meta.fields if not field.primary_key]
+
     def save(self, **kwargs):
+        """Write only the fields that changed since the voter was loaded.
+
+        Progress depends on the user's name, so select_related("user") when
+        loading voters to keep saves without changes free of queries.
+        """
         if self.user.get_full_name().islower():
             self.user.first_name = self.user.first_name.capitalize()
             self.user.last_name = self.user.last_name.capitalize()
             if self.user.pk:
                 self.user.save()
-        with suppress(ValueError):
-            if places := zipcodes.matching(self.zip_code or "0"):
-                abbr = places[0]["state"]
-                self.state = us.states.lookup(abbr).name
-        if self.id:
-            self.friends.remove(self)
+        changed = self.changed_fields
+        if changed is None or "zip_code" in changed:
+            if state := get_state(self.zip_code):
+                self.state = state
         if self.user.pk:
+            self.update_progress()
+            self.update_sort_name()
+            if self.pk and not kwargs:
+                kwargs["update_fields"] = self.changed_fields
             super().save(**kwargs)
+            self.track_changes(kwargs.get("update_fields"))
+            self.notify_progress()
 
 
 class NoteManager(models.Manager):
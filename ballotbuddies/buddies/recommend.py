@@ -0,0 +1,77 @@
+from __future__ import annotations
+
+from collections import Counter
+from typing import Iterable
+
+from django.apps import apps
+from django.db.models import QuerySet
+
+import log
+
+from .graph import EMPTY, SocialGraph, index
+
+
+def recommend(
+    graph: SocialGraph,
+    voters: Iterable[int] | None = None,
+    *,
+    eligible: set[int] | None = None,
+    limit: int = 0,
+) -> dict[int, list[int]]:
+    recommendations: dict[int, list[int]] = {}
+    for voter in graph.friends if voters is None else voters:
+        direct = graph.friends.get(voter, EMPTY)
+        mutual: Counter[int] = Counter()
+        for friend in direct:
+            mutual.update(graph.friends.get(friend, EMPTY))
+        skip = (
+            direct
+            | graph.neighbors.get(voter, EMPTY)
+            | graph.strangers.get(voter, EMPTY)
+            | {voter}
+        )
+        ranked = sorted(
+            (-count, candidate)
+            for candidate, count in mutual.items()
+            if candidate not in skip and (eligible is None or candidate in eligible)
+        )
+        if ranked:
+            candidates = [candidate for _count, candidate in ranked]
+            recommendations[voter] = candidates[:limit] if limit else candidates
+    return recommendations
+
+
+def update_neighbors(
+    voters: QuerySet | None = None, *, limit: int = 0
+) -> dict[int, list[int]]:
+    Voter = apps.get_model("buddies", "Voter")
+    graph = index.graph or SocialGraph.load(voters)
+    eligible = Voter.objects.complete()
+    pks = None
+    if voters is not None:
+        pks = list(voters.values_list("pk", flat=True))
+        reachable = set().union(*(graph.reachable(pk) for pk in pks))
+        eligible = eligible.filter(pk__in=reachable)
+
+    recommendations = recommend(
+        graph,
+        pks,
+        eligible=set(eligible.values_list("pk", flat=True)),
+        limit=limit,
+    )
+    Neighbor = Voter.neighbors.through
+    Neighbor.objects.bulk_create(
+        [
+            Neighbor(from_voter_id=voter, to_voter_id=neighbor)
+            for voter, neighbors in recommendations.items()
+            for neighbor in neighbors
+        ],
+        batch_size=5000,
+        ignore_conflicts=True,
+    )
+    for voter, neighbors in recommendations.items():
+        graph.neighbors.add(voter, *neighbors)
+
+    total = sum(len(neighbors) for neighbors in recommendations.values())
+    log.info(f"Recommended {total} friend(s) to {len(recommendations)} voter(s)")
+    return recommendations
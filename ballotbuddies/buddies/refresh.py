@@ -0,0 +1,228 @@
+from __future__ import annotations
+
+import threading
+import time
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from dataclasses import dataclass, field
+from typing import Iterable, Iterator, NamedTuple
+from urllib.parse import urlparse
+
+import log
+import requests
+
+from ballotbuddies.alerts.models import Profile
+
+from . import constants
+from .elections import calendar
+from .models import Voter
+
+RETRY_STATUS_CODES = {429, 500, 502, 503, 504}
+
+UPDATE_FIELDS = [
+    "status",
+    "progress_data",
+    "progress_rank",
+    "sort_name",
+    "updated",
+]
+RECORDED_FIELDS = [
+    "fetched",
+    "ballot_returned",
+    "voted",
+]
+
+
+class RateLimiter:
+    def __init__(self, rate: float, *, clock=time.monotonic, sleep=time.sleep):
+        self.interval = 1 / rate if rate else 0.0
+        self.clock = clock
+        self.sleep = sleep
+        self._lock = threading.Lock()
+        self._slots: dict[str, float] = {}
+
+    def wait(self, url: str):
+        if not self.interval:
+            return
+        host = urlparse(url).netloc
+        with self._lock:
+            now = self.clock()
+            slot = max(now, self._slots.get(host, now))
+            self._slots[host] = slot + self.interval
+        if slot > now:
+            self.sleep(slot - now)
+
+
+class Client:
+    def __init__(
+        self,
+        *,
+        rate: float = constants.REFRESH_RATE,
+        retries: int = constants.REFRESH_RETRIES,
+        backoff: float = constants.REFRESH_BACKOFF,
+    ):
+        self.limiter = RateLimiter(rate)
+        self.retries = retries
+        self.backoff = backoff
+        self._local = threading.local()
+
+    @property
+    def session(self) -> requests.Session:
+        if not hasattr(self._local, "session"):
+            self._local.session = requests.Session()
+        return self._local.session
+
+    def get(self, url: str, **kwargs) -> requests.Response:
+        attempt = 0
+        while True:
+            self.limiter.wait(url)
+            try:
+                response = self.session.get(url, **kwargs)
+            except requests.RequestException as e:
+                if attempt >= self.retries:
+                    raise
+                log.warning(f"Retrying {url} after error: {e}")
+            else:
+                if response.status_code not in RETRY_STATUS_CODES:
+                    return response
+                if attempt >= self.retries:
+                    return response
+                log.warning(f"Retrying {url} after {response.status_code} response")
+            time.sleep(self.backoff * 2**attempt)
+            attempt += 1
+
+
+class Result(NamedTuple):
+    voter: Voter
+    message: str
+    response: requests.Response | None
+    error: str
+    latency: float
+
+
+@dataclass
+class Stats:
+    total: int = 0
+    updated: int = 0
+    errors: int = 0
+    latencies: list[float] = field(default_factory=list)
+    started: float = field(default_factory=time.monotonic)
+    finished: float = 0.0
+
+    def __str__(self):
+        s = "" if self.total == 1 else "s"
+        return (
+            f"{self.total} voter{s} in {self.elapsed:.1f}s ({self.rate:.1f}/s), "
+            f"{self.updated} updated, {self.errors} error(s), "
+            f"latency p50={self.percentile(50):.0f}ms "
+            f"p95={self.percentile(95):.0f}ms p99={self.percentile(99):.0f}ms"
+        )
+
+    @property
+    def elapsed(self) -> float:
+        return (self.finished or time.monotonic()) - self.started
+
+    @property
+    def rate(self) -> float:
+        return self.total / self.elapsed if self.elapsed else 0.0
+
+    def percentile(self, value: int) -> float:
+        if not self.latencies:
+            return 0.0
+        latencies = sorted(self.latencies)
+        index = min(len(latencies) - 1, int(len(latencies) * value / 100))
+        return latencies[index] * 1000
+
+    def add(self, result: Result):
+        self.total += 1
+        self.latencies.append(result.latency)
+        if result.error:
+            self.errors += 1
+
+
+def fetch_statuses(
+    voters: Iterable[Voter],
+    *,
+    client: Client,
+    workers: int = constants.REFRESH_WORKERS,
+    force: bool = False,
+) -> Iterator[Result]:
+    backlog = max(1, workers) * 4
+    with ThreadPoolExecutor(max_workers=max(1, workers)) as executor:
+        pending: set[Future] = set()
+        for voter in voters:
+            pending.add(executor.submit(_fetch_status, voter, client, force))
+            if len(pending) >= backlog:
+                done, pending = wait(pending, return_when=FIRST_COMPLETED)
+                yield from (future.result() for future in done)
+        for future in wait(pending).done:
+            yield future.result()
+
+
+def _fetch_status(voter: Voter, client: Client, force: bool) -> Result:
+    start = time.monotonic()
+    response = None
+    message = error = ""
+    try:
+        skip, message = voter.check_status(force=force, get=client.get)
+        if not skip:
+            log.info(f"GET {voter.status_api}")
+            response = client.get(voter.status_api, timeout=10)
+            if response.status_code not in {200, 202}:
+                error = f"{response.status_code} response"
+    except (requests.RequestException, ValueError, LookupError) as e:
+        log.error(f"Unable to fetch status for {voter}: {e}")
+        response = None
+        error = str(e) or e.__class__.__name__
+    return Result(voter, message, response, error, time.monotonic() - start)
+
+
+def refresh_statuses(
+    voters: Iterable[Voter],
+    *,
+    force: bool = False,
+    workers: int = constants.REFRESH_WORKERS,
+    rate: float = constants.REFRESH_RATE,
+    retries: int = constants.REFRESH_RETRIES,
+    batch_size: int = 500,
+) -> Stats:
+    stats = Stats()
+    client = Client(rate=rate, retries=retries)
+    calendar.invalidate()
+
+    batch: list[Voter] = []
+    for result in fetch_statuses(voters, client=client, workers=workers, force=force):
+        stats.add(result)
+        if result.response is not None:
+            changed, _message = result.voter.record_status(
+                result.response, result.message, share=False
+            )
+            stats.updated += changed
+        result.voter.update_progress()
+        batch.append(result.voter)
+        if len(batch) >= batch_size:
+            save_voters(batch)
+    save_voters(batch)
+
+    stats.finished = time.monotonic()
+    log.info(f"Refreshed status for {stats}")
+    return stats
+
+
+def save_voters(voters: list[Voter]):
+    if voters:
+        Voter.objects.bulk_update(voters, UPDATE_FIELDS + _recorded_fields(voters))
+        updated = [voter.pk for voter in voters if voter.notify_progress(refresh=False)]
+        Profile.objects.refresh(Profile.objects.filter(voter__in=updated))
+        for voter in voters:
+            if voter.__dict__.pop("_share_pending", False):
+                voter.share_status(defer=True)
+        voters.clear()
+
+
+def _recorded_fields(voters: list[Voter]) -> list[str]:
+    """Include fetch and inference fields only when some voter changed them."""
+    changed: set[str] = set()
+    for voter in voters:
+        fields = voter.changed_fields
+        changed.update(RECORDED_FIELDS if fields is None else fields)
+    return [name for name in RECORDED_FIELDS if name in changed]
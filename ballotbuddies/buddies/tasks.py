@@ -0,0 +1,16 @@
+from ballotbuddies.core.jobs import task
+
+from .models import Voter
+
+
+@task(retries=5, backoff=60)
+def update_status(voter: int):
+    instance: Voter = Voter.objects.get(pk=voter)
+    instance.update_status()
+    instance.save()
+
+
+@task()
+def share_status(voter: int):
+    if instance := Voter.objects.filter(pk=voter).first():
+        instance.share_status()
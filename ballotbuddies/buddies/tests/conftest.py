@@ -1,6 +1,12 @@
+import json
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from threading import Thread
+from urllib.parse import parse_qs, urlparse
+
 import pytest
 
 from .. import constants
+from ..elections import calendar
 
 
 @pytest.fixture(autouse=True)
@@ -13,3 +19,57 @@ def default_constants(monkeypatch):
         ),
     )
     monkeypatch.delenv("TODAY", raising=False)
+    calendar.invalidate()
+
+
+class ElectionsAPI(ThreadingHTTPServer):
+    def __init__(self):
+        super().__init__(("127.0.0.1", 0), ElectionsHandler)
+        self.url = f"http://127.0.0.1:{self.server_port}"
+        self.requests: list[str] = []
+        self.election = {"id": 45, "date": "2021-11-02", "name": "Test Election"}
+        self.errors = 0
+
+
+class ElectionsHandler(BaseHTTPRequestHandler):
+    server: ElectionsAPI
+
+    def do_GET(self):  # pylint: disable=invalid-name
+        self.server.requests.append(self.path)
+        if self.server.errors:
+            self.server.errors -= 1
+            self._respond(503, {})
+        elif self.path.startswith("/api/elections/"):
+            self._respond(200, {"results": [self.server.election]})
+        elif self.path.startswith("/api/status/"):
+            query = parse_qs(urlparse(self.path).query)
+            status = {
+                "id": query["first_name"][0],
+                "status": {"registered": True},
+                "election": self.server.election,
+            }
+            self._respond(200, status)
+        else:
+            self._respond(404, {})
+
+    def _respond(self, code: int, data: dict):
+        body = json.dumps(data).encode()
+        self.send_response(code)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, *_args):
+        pass
+
+
+@pytest.fixture
+def elections_api(monkeypatch):
+    server = ElectionsAPI()
+    thread = Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    monkeypatch.setattr(constants, "ELECTIONS_HOST", server.url)
+    yield server
+    server.shutdown()
+    server.server_close()
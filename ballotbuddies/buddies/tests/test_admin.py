@@ -0,0 +1,19 @@
+# pylint: disable=expression-not-assigned,singleton-comparison,unused-variable
+
+import pytest
+
+from ..admin import VoterAdminForm
+from ..models import User, Voter
+
+
+def describe_voter_admin_form():
+    @pytest.mark.django_db
+    def it_drops_the_voter_from_their_own_friends(expect):
+        voters = [
+            Voter.objects.from_user(User.objects.create(username=name), {})
+            for name in ["alice", "bob"]
+        ]
+        form = VoterAdminForm(instance=voters[0])
+        form.cleaned_data = {"friends": Voter.objects.order_by("pk")}
+
+        expect(list(form.clean_friends())) == [voters[1]]
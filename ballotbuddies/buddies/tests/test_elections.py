@@ -0,0 +1,39 @@
+# pylint: disable=expression-not-assigned,singleton-comparison,unused-variable
+
+from ..elections import ElectionCalendar
+
+
+def describe_election_calendar():
+    def it_caches_elections(expect, elections_api):
+        calendar = ElectionCalendar()
+
+        expect(calendar.get_elections()) == [elections_api.election]
+        expect(calendar.get_elections()) == [elections_api.election]
+
+        expect(elections_api.requests) == ["/api/elections/"]
+
+    def it_can_be_invalidated(expect, elections_api):
+        calendar = ElectionCalendar()
+
+        calendar.get_elections()
+        calendar.invalidate()
+        calendar.get_elections()
+
+        expect(len(elections_api.requests)) == 2
+
+    def it_expires_after_ttl(expect, elections_api):
+        calendar = ElectionCalendar(ttl=0)
+
+        calendar.get_elections()
+        calendar.get_elections()
+
+        expect(len(elections_api.requests)) == 2
+
+    def it_returns_none_when_unavailable(expect, elections_api):
+        elections_api.errors = 1
+        calendar = ElectionCalendar()
+
+        expect(calendar.get_elections()) == None
+        expect(calendar.get_elections()) == None
+
+        expect(len(elections_api.requests)) == 1
@@ -0,0 +1,56 @@
+# pylint: disable=expression-not-assigned,singleton-comparison,unused-variable
+
+import asyncio
+from datetime import date
+
+import pytest
+
+from ..constants import VOTED
+from ..export import COLUMNS, iter_csv, iter_jsonl, iter_rows, stream
+from ..models import User, Voter
+
+
+@pytest.mark.django_db
+def describe_iter_rows():
+    def it_recomputes_out_of_date_snapshots(expect):
+        user = User.objects.create(username="jane", first_name="Jane")
+        voter = Voter.objects.from_user(user, VOTED.status)
+        stale = voter.progress_data | {"key": "", "percent": -1}
+        Voter.objects.filter(pk=voter.pk).update(progress_data=stale)
+
+        rows = list(iter_rows(Voter.objects.all()))
+
+        expect(rows[0]["first_name"]) == "Jane"
+        expect(rows[0]["percent"]) == voter.progress_data["percent"]
+
+
+def describe_iter_csv():
+    def it_writes_a_header_and_rows(expect):
+        rows = [dict.fromkeys(COLUMNS, "") | {"id": 1, "percent": 50}]
+
+        lines = list(iter_csv(rows))
+
+        expect(lines[0]).startswith("id,first_name,")
+        expect(lines[1]).startswith("1,,")
+
+
+def describe_iter_jsonl():
+    def it_writes_one_object_per_line(expect):
+        rows: list[dict] = [
+            {"id": 1, "voted": date(2024, 11, 5)},
+            {"id": 2, "voted": None},
+        ]
+
+        expect(list(iter_jsonl(rows))) == [
+            '{"id": 1, "voted": "2024-11-05"}\n',
+            '{"id": 2, "voted": null}\n',
+        ]
+
+
+def describe_stream():
+    def it_yields_lines_in_chunks(expect):
+        async def collect():
+            lines = (f"{number}\n" for number in range(5))
+            return [chunk async for chunk in stream(lines, size=2)]
+
+        expect(asyncio.run(collect())) == ["0\n1\n", "2\n3\n", "4\n"]
@@ -0,0 +1,42 @@
+# pylint: disable=expression-not-assigned,singleton-comparison,unused-variable
+
+from ..geography import build_zip_states, get_state, is_valid_zip_code, load_zip_states
+
+
+def describe_build_zip_states():
+    def it_round_trips_states(expect, tmp_path):
+        path = tmp_path / "zip_states.bin"
+        path.write_bytes(build_zip_states([("00501", "New York"), ("48105", "Ohio")]))
+
+        states, table = load_zip_states.__wrapped__(path)
+
+        expect(states) == ["", "New York", "Ohio"]
+        expect(table[501]) == 1
+        expect(table[48105]) == 2
+        expect(len(table)) == 100_000
+
+
+def describe_get_state():
+    def it_finds_states_by_zip_code(expect):
+        expect(get_state("48105")) == "Michigan"
+        expect(get_state("94040")) == "California"
+        expect(get_state("00601")) == "Puerto Rico"
+
+    def it_handles_invalid_zip_codes(expect):
+        expect(get_state(None)) == ""
+        expect(get_state("?????")) == ""
+        expect(get_state("4810")) == ""
+        expect(get_state("00000")) == ""
+
+
+def describe_is_valid_zip_code():
+    def it_allows_the_test_zip_code(expect):
+        expect(is_valid_zip_code("99999")) == True
+
+    def it_allows_zip_codes_missing_from_the_table(expect):
+        expect(get_state("00000")) == ""
+        expect(is_valid_zip_code("00000")) == True
+
+    def it_rejects_malformed_zip_codes(expect):
+        expect(is_valid_zip_code("4810")) == False
+        expect(is_valid_zip_code("48l05")) == False
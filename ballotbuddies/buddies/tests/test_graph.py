@@ -0,0 +1,70 @@
+# pylint: disable=expression-not-assigned,singleton-comparison,unused-variable,redefined-outer-name
+
+import pytest
+
+from ..graph import Degree, Index, Relation, SocialGraph
+
+
+@pytest.fixture
+def graph():
+    return SocialGraph(
+        friends=Relation([(1, 2), (1, 3), (2, 1), (2, 4), (3, 4), (4, 5)]),
+        neighbors=Relation([(1, 4)]),
+        strangers=Relation([(1, 5)]),
+    )
+
+
+def describe_relation():
+    def it_maps_sources_to_targets(expect):
+        relation = Relation([(3, 1), (1, 2), (1, 3), (1, 2)])
+
+        expect(dict(relation)) == {1: {2, 3}, 3: {1}}
+        expect(relation.has(1, 3)) == True
+        expect(relation.has(3, 3)) == False
+        expect(relation.degree(1)) == 2
+        expect(relation.degree(2)) == 0
+
+    def it_applies_incremental_updates(expect):
+        relation = Relation([(1, 2), (1, 3)])
+        expect(relation.reverse.get(2)) == {1}
+
+        relation.add(4, 2)
+        relation.remove(1, 2, 3)
+
+        expect(dict(relation)) == {4: {2}}
+        expect(relation.has(1, 2)) == False
+        expect(dict(relation.reverse)) == {2: {4}}
+
+
+def describe_social_graph():
+    def it_finds_followers_and_mutuals(expect, graph):
+        expect(graph.followers(4)) == {2, 3}
+        expect(graph.mutuals(1)) == {2}
+
+    def it_counts_degrees(expect, graph):
+        expect(graph.degree(1)) == Degree(
+            friends=2, followers=1, neighbors=1, strangers=1
+        )
+
+    def it_finds_reachable_voters(expect, graph):
+        expect(graph.reachable(1)) == {2, 3, 4}
+        expect(graph.reachable(1, hops=3)) == {2, 3, 4, 5}
+
+
+def describe_index():
+    def it_ignores_updates_when_unloaded(expect):
+        index = Index()
+
+        index.link("friends", 1, 2)
+
+        expect(index.graph) == None
+
+    def it_updates_the_loaded_graph(expect, graph):
+        index = Index()
+        index.graph = graph
+
+        index.link("friends", 5, 1)
+        index.unlink("neighbors", 1, 4)
+
+        expect(graph.followers(1)) == {2, 5}
+        expect(graph.neighbors.get(1)) == None
@@ -3,6 +3,7 @@
 import pytest
 
 from .. import helpers
+from ..models import Voter
 
 
 @pytest.mark.django_db
@@ -15,3 +16,14 @@ def test_update_neighbors(expect):
 def test_update_statuses(expect):
     helpers.generate_sample_voters()
     expect(helpers.update_statuses()) == 0
+
+
+@pytest.mark.django_db
+def test_update_rankings(expect):
+    helpers.generate_sample_voters()
+    helpers.update_rankings()
+    expect(helpers.update_rankings()) == 0
+
+    count = Voter.objects.update(progress_data={})
+    expect(helpers.update_rankings()) == count
+    expect(Voter.objects.filter(progress_data={}).count()) == 0
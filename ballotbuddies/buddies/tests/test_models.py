@@ -2,6 +2,9 @@
 
 from dataclasses import asdict
 
+from django.db import IntegrityError, connection
+from django.template.loader import render_to_string
+from django.test.utils import CaptureQueriesContext
 from django.utils import timezone
 
 import pytest
@@ -14,6 +17,7 @@ from ..constants import (
     VOTED,
     VoterData,
 )
+from ..graph import index
 from ..models import User, Voter
 
 
@@ -52,6 +56,24 @@ def describe_voter():
 
             expect(voter.progress.voted.color) == "success text-muted"
 
+        def with_current_snapshot(expect, voter: Voter):
+            voter.status = REGISTERED.status
+            voter.update_progress()
+            voter.progress_data["percent"] = 42  # type: ignore
+
+            expect(voter.progress_current) == True
+            expect(voter.progress.percent) == 42
+
+        def with_stale_snapshot(expect, voter: Voter):
+            voter.status = REGISTERED.status
+            voter.update_progress()
+            voter.progress_data["percent"] = 42  # type: ignore
+
+            voter.absentee = False
+
+            expect(voter.progress_current) == False
+            expect(voter.progress.percent) == 50
+
     def describe_activity():
         @pytest.mark.parametrize(
             ("status", "activity"),
@@ -86,6 +108,61 @@ def describe_voter():
             expect(updated) == False
             expect(error) == ""
 
+    def describe_row():
+        @pytest.fixture
+        def render(rf, voter: Voter):
+            request = rf.get("/friends/")
+            request.user = voter.user
+            context = {"voter": voter, "recommended": [], "preview": True}
+            return lambda: render_to_string("friends/_row.html", context, request)
+
+        def it_caches_rendered_rows(expect, voter: Voter, render):
+            voter.pk = 42
+            voter.status = REGISTERED.status
+            html = render()
+
+            voter.__dict__["progress"] = None
+
+            expect(render()) == html
+
+        def it_skips_caching_sample_voters(expect, voter: Voter, render):
+            voter.status = REGISTERED.status
+            html = render()
+
+            sample = Voter(user=voter.user, state="Michigan", status=VOTED.status)
+            voter.__dict__["progress"] = sample.progress
+
+            expect(render()) != html
+
+        def it_invalidates_when_status_changes(expect, voter: Voter, render):
+            voter.pk = 42
+            voter.status = REGISTERED.status
+            html = render()
+
+            voter.status = VOTED.status
+            voter.__dict__.pop("progress")
+
+            expect(render()) != html
+
+    def describe_community():
+        @pytest.mark.django_db
+        def it_is_ordered_by_progress_then_name(expect, voter: Voter):
+            voter.user.save()
+            voter.save()
+            for name, sample in [("Zed", VOTED), ("Amy", UNREGISTERED), ("Bob", VOTED)]:
+                user = User.objects.create(username=name, first_name=name)
+                voter.friends.add(Voter.objects.from_user(user, sample.status))
+
+            community = list(voter.community)
+
+            expect(community) == sorted(community)
+            expect([friend.short_name for friend in community]) == [
+                "Bob",
+                "Zed",
+                "Amy",
+                "Rosalynn",
+            ]
+
     def describe_update_neighbors():
         @pytest.mark.django_db
         def it_returns_count_of_added_neighbors(expect, voter: Voter):
@@ -96,6 +173,40 @@ def describe_voter():
 
             expect(count) == 0
 
+    def describe_friends_cta():
+        @pytest.mark.django_db
+        def it_counts_each_relation_separately(expect, voter: Voter):
+            voter.user.save()
+            voter.save()
+            for name, sample in [("Amy", VOTED), ("Bob", VOTED), ("Cal", REGISTERED)]:
+                user = User.objects.create(username=name, first_name=name)
+                voter.friends.add(Voter.objects.from_user(user, sample.status))
+            user = User.objects.create(username="Dee", first_name="Dee")
+            voter.neighbors.add(Voter.objects.from_user(user, VOTED.status))
+
+            expect(voter.friends_cta) == (
+                "You follow 3 voters and have 1 recommended friend. "
+                "3 of them have already cast their ballot. "
+                "Invite more friends to promote democracy!"
+            )
+
+    def describe_share_status():
+        @pytest.mark.django_db
+        def it_reads_friends_from_a_loaded_graph(expect, voter: Voter):
+            voter.user.save()
+            voter.save()
+            user = User.objects.create(username="friend", first_name="Friend")
+            voter.friends.add(Voter.objects.from_user(user, REGISTERED.status))
+
+            with index.load():
+                with CaptureQueriesContext(connection) as context:
+                    count = voter.share_status()
+
+            expect(count) == 1
+            expect(
+                [q for q in context.captured_queries if "voter_friends" in q["sql"]]
+            ) == []
+
     def describe_save():
         def it_formats_name(expect, voter: Voter):
             voter.user.first_name = "jane"
@@ -106,14 +217,53 @@ def describe_voter():
             expect(voter.user.get_full_name()) == "Jane Doe"
 
         @pytest.mark.django_db
-        def it_remove_self_from_friends(expect, voter: Voter):
+        def it_prevents_self_friendship(voter: Voter):
+            voter.user.save()
+            voter.save()
+
+            with pytest.raises(IntegrityError):
+                voter.friends.add(voter)
+
+        @pytest.mark.django_db
+        def it_skips_self_links_when_adding_friends(expect, voter: Voter):
             voter.user.save()
             voter.save()
 
-            voter.friends.add(voter)
+            expect(voter.add_friend(voter.slug)) == (None, False)
+            expect(voter.friends.count()) == 0
+
+        @pytest.mark.django_db
+        def it_only_writes_changed_fields(expect, voter: Voter):
+            voter.user.save()
             voter.save()
+            voter = Voter.objects.select_related("user").get(pk=voter.pk)
+
+            with CaptureQueriesContext(connection) as context:
+                voter.save()
+            expect(len(context)) == 0
 
-            expect(voter.friends.all()).excludes(voter)
+            voter.nickname = "Janie"
+            expect(voter.changed_fields) == ["nickname"]
+            with CaptureQueriesContext(connection) as context:
+                voter.save()
+            expect(len(context)) == 1
+            expect(voter.changed_fields) == []
+
+        @pytest.mark.django_db
+        def it_refreshes_progress_after_completing_setup(expect):
+            voter = Voter.objects.from_email("jane@example.com", "")
+            expect(voter.complete) == False
+
+            voter.user.first_name = "Jane"
+            voter.user.last_name = "Doe"
+            voter.user.save()
+            voter.birth_date = "1985-02-06"
+            voter.zip_code = "49503"
+            voter.save()
+
+            voter = Voter.objects.get(pk=voter.pk)
+            expect(voter.complete) == True
+            expect(voter.progress_current) == True
 
         def it_updates_state(expect, voter: Voter):
             voter.zip_code = "94040"
@@ -126,3 +276,35 @@ def describe_voter():
             voter.save()
 
             expect(voter.state) == "Michigan"
+
+
+def describe_voter_manager():
+    def describe_invite():
+        @pytest.fixture
+        def voter():
+            user = User.objects.create(
+                username="jane", email="jane@example.org", first_name="Jane"
+            )
+            return Voter.objects.from_user(user)
+
+        @pytest.mark.django_db
+        def it_creates_friendships_in_both_directions(expect, voter, mailoutbox):
+            friends = Voter.objects.invite(
+                voter, ["Bob@example.org", "bob@example.org", "jane@example.org"]
+            )
+
+            expect(len(friends)) == 1
+            expect(friends[0].referrer) == voter
+            expect(list(friends[0].friends.all())) == [voter]
+            expect(list(voter.friends.all())) == friends
+            expect(len(mailoutbox)) == 1
+
+        @pytest.mark.django_db
+        def it_uses_a_constant_number_of_queries(expect, voter):
+            def invite(count: int, offset: int) -> int:
+                emails = [f"friend{offset + n}@example.org" for n in range(count)]
+                with CaptureQueriesContext(connection) as context:
+                    Voter.objects.invite(voter, emails)
+                return len(context)
+
+            expect(invite(50, 0)) == invite(5, 100)
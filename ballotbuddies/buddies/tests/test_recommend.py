@@ -0,0 +1,82 @@
+# pylint: disable=expression-not-assigned,singleton-comparison,unused-variable,redefined-outer-name
+
+import random
+
+import pytest
+
+from ..graph import Relation, SocialGraph
+from ..recommend import recommend
+
+
+def build(friends: dict[int, set[int]], **excluded: dict[int, set[int]]):
+    return SocialGraph(
+        **{
+            name: Relation(
+                (source, target)
+                for source, targets in relation.items()
+                for target in targets
+            )
+            for name, relation in dict(friends=friends, **excluded).items()
+        }
+    )
+
+
+@pytest.fixture
+def friends():
+    return {
+        1: {2, 3},
+        2: {1, 4, 5},
+        3: {1, 4, 6},
+        4: {2, 3},
+        5: {2},
+        6: {3, 7},
+    }
+
+
+def describe_recommend():
+    def it_ranks_friends_of_friends_by_mutual_count(expect, friends):
+        recommendations = recommend(build(friends), [1])
+
+        expect(recommendations) == {1: [4, 5, 6]}
+
+    def it_excludes_existing_neighbors_and_strangers(expect, friends):
+        recommendations = recommend(
+            build(friends, neighbors={1: {4}}, strangers={1: {6}}), [1]
+        )
+
+        expect(recommendations) == {1: [5]}
+
+    def it_skips_ineligible_candidates(expect, friends):
+        recommendations = recommend(build(friends), [1], eligible={2, 3, 5, 6})
+
+        expect(recommendations) == {1: [5, 6]}
+
+    def it_limits_recommendations(expect, friends):
+        recommendations = recommend(build(friends), limit=1)
+
+        expect(recommendations[1]) == [4]
+        expect(recommendations[4]) == [1]
+        expect(recommendations[6]) == [1]
+
+    def it_never_recommends_self_or_friends(expect, friends):
+        recommendations = recommend(build(friends))
+
+        for voter, neighbors in recommendations.items():
+            expect(neighbors).excludes(voter)
+            expect(set(neighbors) & friends[voter]) == set()
+
+    def it_recommends_for_random_graphs(expect):
+        rng = random.Random(0)
+        count = 2_000
+        friends = {
+            voter: {rng.randrange(count) for _ in range(5)} - {voter}
+            for voter in range(count)
+        }
+
+        recommendations = recommend(build(friends), limit=3)
+
+        expect(len(recommendations)) > count * 0.99
+        for voter, neighbors in recommendations.items():
+            expect(len(neighbors)) <= 3
+            expect(neighbors).excludes(voter)
+            expect(set(neighbors) & friends[voter]) == set()
@@ -0,0 +1,120 @@
+# pylint: disable=expression-not-assigned,singleton-comparison,unused-variable,redefined-outer-name
+
+import pytest
+
+from ballotbuddies.core.models import Job
+
+from ..models import User, Voter
+from ..refresh import (
+    Client,
+    RateLimiter,
+    Stats,
+    _recorded_fields,
+    fetch_statuses,
+    save_voters,
+)
+
+
+@pytest.fixture
+def voters():
+    return [
+        Voter(
+            user=User(first_name=f"Voter{index}", last_name="Test"),
+            birth_date="1975-08-03",
+            zip_code="49503",
+            state="Michigan",
+        )
+        for index in range(10)
+    ]
+
+
+def describe_fetch_statuses():
+    @pytest.mark.usefixtures("elections_api")
+    def it_fetches_each_voter(expect, voters):
+        client = Client(rate=0, retries=0)
+
+        results = list(fetch_statuses(voters, client=client, workers=4))
+        responses = [r.response for r in results if r.response is not None]
+
+        expect({result.error for result in results}) == {""}
+        expect(len(responses)) == 10
+        expect({response.json()["id"] for response in responses}) == {
+            voter.user.first_name for voter in voters
+        }
+
+    def it_fetches_elections_once(expect, elections_api, voters):
+        client = Client(rate=0, retries=0)
+
+        list(fetch_statuses(voters, client=client, workers=4))
+
+        expect(elections_api.requests.count("/api/elections/")) == 1
+
+    def it_retries_server_errors(expect, elections_api, voters):
+        elections_api.errors = 2
+        client = Client(rate=0, retries=3, backoff=0)
+
+        results = list(fetch_statuses(voters[:1], client=client, workers=1))
+
+        expect(results[0].error) == ""
+        expect(results[0].response and results[0].response.status_code) == 200
+
+    def it_reports_exhausted_retries(expect, elections_api, voters):
+        elections_api.errors = 99
+        client = Client(rate=0, retries=1, backoff=0)
+
+        results = list(fetch_statuses(voters[:2], client=client, workers=2))
+
+        expect([result.error for result in results]) == [
+            "503 response",
+            "503 response",
+        ]
+
+
+def describe_save_voters():
+    @pytest.mark.django_db
+    def it_shares_changed_statuses_after_saving(expect, settings, voters):
+        settings.JOBS_EAGER = False
+        voter = voters[0]
+        voter.user.save()
+        voter.save()
+        voter.__dict__["_share_pending"] = True
+
+        save_voters([voter])
+
+        expect(list(Job.objects.values_list("name", "key"))) == [
+            ("buddies.share_status", f"share_status:{voter.pk}")
+        ]
+
+
+def describe_recorded_fields():
+    def it_only_includes_fields_that_changed(expect, voters):
+        for voter in voters:
+            voter.track_changes()
+        voters[3].voted = "2024-11-05"
+
+        expect(_recorded_fields(voters)) == ["voted"]
+
+    def it_includes_everything_for_untracked_voters(expect, voters):
+        expect(_recorded_fields(voters)) == ["fetched", "ballot_returned", "voted"]
+
+
+def describe_rate_limiter():
+    def it_spaces_requests_per_host(expect):
+        sleeps: list[float] = []
+        limiter = RateLimiter(rate=50, clock=lambda: 0.0, sleep=sleeps.append)
+
+        for _ in range(5):
+            limiter.wait("http://example.com/api/status/")
+        limiter.wait("http://example.org/api/status/")
+
+        expect([round(delay, 2) for delay in sleeps]) == [0.02, 0.04, 0.06, 0.08]
+
+
+def describe_stats():
+    def it_summarizes_throughput_and_latency(expect):
+        stats = Stats(total=4, updated=1, errors=1, latencies=[0.1, 0.2, 0.3, 0.4])
+        stats.finished = stats.started + 2
+
+        expect(stats.rate) == 2
+        expect(stats.percentile(50)) == 300
+        expect(str(stats)).contains("4 voters in 2.0s (2.0/s), 1 updated, 1 error(s)")
@@ -1,5 +1,6 @@
 # pylint: disable=expression-not-assigned,singleton-comparison,unused-variable
 
+import json
 from dataclasses import asdict
 
 import pytest
@@ -51,3 +52,16 @@ def describe_progress():
         def with_samples(expect, sample):
             result = Progress.parse(sample.status)
             expect(asdict(result)) == sample.progress
+
+    def describe_snapshot():
+        @pytest.mark.parametrize("sample", SAMPLE_DATA)
+        def it_round_trips_through_json(expect, sample):
+            progress = Progress.parse(sample.status)
+
+            data = json.loads(json.dumps(progress.snapshot))
+            result = Progress.from_snapshot(data)
+
+            expect(asdict(result)) == asdict(progress)
+            expect(result.values) == progress.values
+            expect(result.percent) == progress.percent
+            expect(result.actions) == progress.actions
@@ -1,16 +1,21 @@
 # pylint: disable=unused-variable,redefined-outer-name,expression-not-assigned
 
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
 from django.urls import reverse
 from django.utils import timezone
 
 import pytest
 from expecter import expect
 
+from ballotbuddies.core.models import Job
 from ballotbuddies.core.tests import decode
 
 from ..constants import VOTED
 from ..models import User, Voter
 
+QUERY_BUDGET = 15
+
 
 @pytest.fixture
 def voter(admin_user: User):
@@ -120,6 +125,44 @@ def describe_friends():
             expect(html.count('id="toggle-')) == 0
             expect(html).excludes(friend.nickname)
 
+        def it_fetches_the_first_status_inline(expect, client, admin_user, settings):
+            settings.JOBS_EAGER = False
+            voter = Voter.objects.from_user(admin_user)
+            client.force_login(admin_user)
+
+            client.get("/friends/")
+
+            voter.refresh_from_db()
+            expect(voter.updated).is_not(None)
+            expect(Job.objects.count()) == 0
+
+        def it_uses_a_constant_number_of_queries(expect, client, voter: Voter):
+            voter.updated = timezone.now()
+            voter.save()
+            client.force_login(voter.user)
+            client.get("/friends/")
+
+            counts = []
+            for total in [10, 100, 1000]:
+                start = voter.friends.count()
+                users = User.objects.bulk_create(
+                    User(username=f"friend{index}", first_name=f"Friend{index}")
+                    for index in range(start, total)
+                )
+                friends = Voter.objects.bulk_create(Voter(user=user) for user in users)
+                voter.friends.add(*friends)
+
+                with CaptureQueriesContext(connection) as context:
+                    response = client.get("/friends/")
+
+                expect(
+                    decode(response, verbose=False).count('id="toggle-')
+                ) == total + 1
+                counts.append(len(context))
+
+            expect(counts) == [counts[0]] * 3
+            expect(counts[0]) <= QUERY_BUDGET
+
     def describe_detail():
         def it_redirects_for_invalid_slugs(expect, client, voter: Voter):
             client.force_login(voter.user)
@@ -186,3 +229,31 @@ def describe_friends():
 
             voter.refresh_from_db()
             expect(voter.ballot).is_(None)
+
+
+@pytest.mark.django_db
+def describe_export():
+    @pytest.mark.usefixtures("friend")
+    def it_streams_voter_progress_as_csv(expect, client, voter):
+        client.force_login(voter.user)
+
+        response = client.get("/export/voters.csv")
+
+        expect(response["Content-Type"]) == "text/csv"
+        lines = b"".join(response).decode().splitlines()
+        expect(lines[0]).startswith("id,first_name,last_name")
+        expect(len(lines)) == 3
+
+    def it_rejects_unknown_formats(expect, client, voter):
+        client.force_login(voter.user)
+
+        response = client.get("/export/voters.xml")
+
+        expect(response.status_code) == 400
+
+    def it_requires_staff(expect, client, friend):
+        client.force_login(friend.user)
+
+        response = client.get("/export/voters.csv")
+
+        expect(response.status_code) == 302
@@ -1,6 +1,6 @@
 from __future__ import annotations
 
-from dataclasses import asdict, dataclass, field
+from dataclasses import asdict, astuple, dataclass, field, fields
 from datetime import date, datetime
 from functools import cached_property
 
@@ -174,6 +174,21 @@ class Progress:
             self.registered.value,
         )
 
+    @property
+    def snapshot(self) -> dict:
+        return {
+            "states": [astuple(getattr(self, f.name)) for f in fields(self)],
+            "values": self.values,
+            "percent": self.percent,
+            "actions": self.actions,
+        }
+
+    @classmethod
+    def from_snapshot(cls, data: dict) -> Progress:
+        progress = cls(*(State(*values) for values in data["states"]))
+        progress.__dict__.update(percent=data["percent"], actions=data["actions"])
+        return progress
+
     @cached_property
     def percent(self) -> int:
         if not self.registered.complete:
@@ -20,4 +20,6 @@ urlpatterns = [
     path("friends/<slug>/_email", views.friends_email, name="email"),
     # Notes
     path("friends/<slug>/_note/", views.friends_note, name="note"),
+    # Export
+    path("export/voters.<str:extension>", views.voters_export, name="export"),
 ]
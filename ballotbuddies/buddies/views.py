@@ -1,16 +1,27 @@
 import time
 
 from django.contrib import messages
+from django.contrib.admin.views.decorators import staff_member_required
 from django.contrib.auth.decorators import login_required
 from django.contrib.auth.models import User
 from django.db.models import Q
-from django.http import HttpRequest, HttpResponse, JsonResponse
+from django.http import (
+    HttpRequest,
+    HttpResponse,
+    HttpResponseBadRequest,
+    JsonResponse,
+    StreamingHttpResponse,
+)
 from django.shortcuts import redirect, render, resolve_url
 from django.utils import timezone
 
 import log
 
+from ballotbuddies.core.jobs import enqueue
+
+from . import export
 from .forms import FriendsForm, VoterForm
+from .graph import index
 from .models import Note, Voter
 
 ###############################################################################
@@ -53,10 +64,10 @@ def profile_setup(request: HttpRequest):
         if form.is_valid():
             voter = form.save()
             voter.updated = None
-            voter.save()
             voter.user.update_name(  # type: ignore
-                request, form.cleaned_data["first_name"], form.cleaned_data["last_name"]
+                form.cleaned_data["first_name"], form.cleaned_data["last_name"]
             )
+            voter.save()
             messages.success(request, "Successfully updated your profile information.")
             return redirect("buddies:profile")
     else:
@@ -99,11 +110,18 @@ def friends(request: HttpRequest):
     voter: Voter = Voter.objects.from_user(request.user)
 
     if not voter.updated:
-        voter.update_status()
-        voter.save()
+        if voter.status:
+            enqueue(
+                "buddies.update_status",
+                key=f"update_status:{voter.pk}",
+                voter=voter.pk,
+            )
+        else:
+            voter.update_status()
+            voter.save()
 
     if request.method == "POST":
-        form = FriendsForm(request.POST, required=len(voter.community) < 10)
+        form = FriendsForm(request.POST, required=voter.community.count() < 10)
         if form.is_valid():
             if not form.cleaned_data["emails"]:
                 return redirect("buddies:invite")
@@ -118,7 +136,7 @@ def friends(request: HttpRequest):
     context = {
         "cta": voter.friends_cta,
         "community": voter.community,
-        "recommended": voter.neighbors.all(),
+        "recommended": set(voter.neighbors.values_list("pk", flat=True)),
         "form": form,
     }
     return render(request, "friends/index.html", context)
@@ -151,7 +169,7 @@ def friends_search(request: HttpRequest):
 
     log.info(f"Found {queryset.count()} friend(s) for {partial=} {ballot=} {voted=}")
     context = {
-        "community": sorted(queryset, reverse=True),
+        "community": queryset.order_by("progress_rank", "-sort_name"),
         "recommended": [],
         "search": True,
         "ballot": ballot,
@@ -184,7 +202,7 @@ def friends_profile(request: HttpRequest, slug: str):
         voter.ballot_shared = timezone.now()
         voter.save()
         if not previously_shared:
-            voter.share_status()
+            voter.share_status(defer=True)
 
     if not request.user.is_authenticated:
         messages.info(request, "Please log in to view your friend's profile.")
@@ -211,10 +229,10 @@ def friends_setup(request: HttpRequest, slug: str):
         form = VoterForm(request.POST, instance=voter, initial=voter.data)
         if form.is_valid():
             voter = form.save()
-            voter.save()
             voter.user.update_name(  # type: ignore
-                request, form.cleaned_data["first_name"], form.cleaned_data["last_name"]
+                form.cleaned_data["first_name"], form.cleaned_data["last_name"]
             )
+            voter.save()
             messages.success(request, "Successfully updated your friend's information.")
             return redirect("buddies:friends-profile", slug=slug)
     else:
@@ -247,6 +265,9 @@ def friends_status(request: HttpRequest, slug: str):
         request.user.voter.friends.remove(voter)
         request.user.voter.neighbors.remove(voter)
         request.user.voter.strangers.add(voter)
+        index.unlink("friends", request.user.voter.pk, voter.pk)
+        index.unlink("neighbors", request.user.voter.pk, voter.pk)
+        index.link("strangers", request.user.voter.pk, voter.pk)
         request.user.voter.save()
         if "redirect" in request.POST:
             messages.info(request, "Successfully unfollowed voter.")
@@ -254,10 +275,12 @@ def friends_status(request: HttpRequest, slug: str):
                 status=302, headers={"HX-Redirect": resolve_url("buddies:friends")}
             )
 
-    if "add" in request.POST:
+    if "add" in request.POST and voter != request.user.voter:
         log.info(f"Following voter: {voter}")
         request.user.voter.neighbors.remove(voter)
         request.user.voter.friends.add(voter)
+        index.unlink("neighbors", request.user.voter.pk, voter.pk)
+        index.link("friends", request.user.voter.pk, voter.pk)
         request.user.voter.save()
         voter.profile.alert(request.user.voter)
 
@@ -275,7 +298,7 @@ def friends_status(request: HttpRequest, slug: str):
         voter.promoter = request.user.voter
         voter.updated = timezone.now()
         voter.save()
-        voter.share_status()
+        voter.share_status(defer=True)
         render_as_table = True
 
     if "voted" in request.POST:
@@ -284,7 +307,7 @@ def friends_status(request: HttpRequest, slug: str):
         voter.promoter = request.user.voter
         voter.updated = timezone.now()
         voter.save()
-        voter.share_status()
+        voter.share_status(defer=True)
         render_as_table = True
 
     if "reset" in request.POST or "reset" in request.GET:
@@ -329,3 +352,27 @@ def friends_invite(request: HttpRequest):
 
     context = {"form": form, "qr_code": True}
     return render(request, "invite/index.html", context)
+
+
+###############################################################################
+# Export
+
+
+@staff_member_required
+def voters_export(request: HttpRequest, extension: str):
+    if extension not in export.FORMATS:
+        return HttpResponseBadRequest(f"Unknown export format: {extension}")
+
+    complete = {"true": True, "false": False}.get(request.GET.get("complete", ""))
+    query = export.filter_voters(
+        state=request.GET.get("state", ""),
+        election=request.GET.get("election", ""),
+        complete=complete,
+    )
+    log.info(f"Exporting voters as {extension}: {request.GET.dict()}")
+
+    content_type, render_rows = export.FORMATS[extension]
+    lines = render_rows(export.iter_rows(query))
+    response = StreamingHttpResponse(export.stream(lines), content_type=content_type)
+    response["Content-Disposition"] = f'attachment; filename="voters.{extension}"'
+    return response
@@ -1,6 +1,16 @@
 from django.contrib import admin
 
+from .models import Job
+
 admin.site.site_header = "Ballot Buddies Admin"
 admin.site.site_title = "Ballot Buddies Admin"
 admin.site.index_title = "Home"
 admin.site.enable_nav_sidebar = False
+
+
+@admin.register(Job)
+class JobAdmin(admin.ModelAdmin):
+    search_fields = ["name", "key"]
+    list_filter = ["status", "name"]
+    list_display = ["name", "key", "status", "attempts", "run_at", "finished"]
+    readonly_fields = ["created", "started", "finished"]
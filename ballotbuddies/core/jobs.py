@@ -0,0 +1,149 @@
+from __future__ import annotations
+
+import time
+from dataclasses import dataclass
+from datetime import timedelta
+from typing import Callable
+
+from django.conf import settings
+from django.db import IntegrityError, transaction
+from django.db.models import Avg, Count, F, Min, Q
+from django.utils import timezone
+from django.utils.module_loading import autodiscover_modules
+
+import log
+
+from .models import Job
+
+
+@dataclass
+class Task:
+    name: str
+    function: Callable
+    retries: int
+    backoff: int
+
+
+TASKS: dict[str, Task] = {}
+
+
+def task(*, retries: int = 3, backoff: int = 30):
+    def decorator(function: Callable) -> Callable:
+        app = function.__module__.split(".")[-2]
+        name = f"{app}.{function.__name__}"
+        TASKS[name] = Task(name, function, retries, backoff)
+        return function
+
+    return decorator
+
+
+def get_task(name: str) -> Task:
+    if name not in TASKS:
+        autodiscover_modules("tasks")
+    return TASKS[name]
+
+
+def enqueue(name: str, *, key: str = "", delay: int = 0, **kwargs) -> Job | None:
+    if settings.JOBS_EAGER:
+        get_task(name).function(**kwargs)
+        return None
+
+    run_at = timezone.now() + timedelta(seconds=delay)
+    try:
+        with transaction.atomic():
+            job = Job.objects.create(name=name, key=key, kwargs=kwargs, run_at=run_at)
+    except IntegrityError:
+        log.debug(f"Job already queued: {name}({key})")
+        return Job.objects.filter(
+            key=key, status__in=[Job.Status.QUEUED, Job.Status.RUNNING]
+        ).first()
+    log.debug(f"Queued job: {job}")
+    return job
+
+
+def claim(limit: int = 10) -> list[Job]:
+    now = timezone.now()
+    expired = now - timedelta(seconds=settings.JOBS_LEASE)
+    with transaction.atomic():
+        jobs = list(
+            Job.objects.select_for_update(skip_locked=True).filter(
+                Q(status=Job.Status.QUEUED, run_at__lte=now)
+                | Q(status=Job.Status.RUNNING, started__lt=expired)
+            )[:limit]
+        )
+        for job in jobs:
+            if job.status == Job.Status.RUNNING:
+                log.warning(f"Reclaiming job after its lease expired: {job}")
+            job.status = Job.Status.RUNNING
+            job.attempts += 1
+            job.started = timezone.now()
+        Job.objects.bulk_update(jobs, ["status", "attempts", "started"])
+    return jobs
+
+
+def run(job: Job) -> bool:
+    try:
+        get_task(job.name).function(**job.kwargs)
+    except Exception as e:  # pylint: disable=broad-except
+        job.error = f"{e.__class__.__name__}: {e}"
+        if job.name in TASKS and job.attempts <= TASKS[job.name].retries:
+            delay = TASKS[job.name].backoff * 2 ** (job.attempts - 1)
+            log.warning(f"Retrying {job} in {delay}s after error: {job.error}")
+            job.status = Job.Status.QUEUED
+            job.run_at = timezone.now() + timedelta(seconds=delay)
+        else:
+            log.error(f"Job failed after {job.attempts} attempt(s): {job}")
+            job.status = Job.Status.FAILED
+            job.finished = timezone.now()
+        job.save()
+        return False
+
+    job.status = Job.Status.DONE
+    job.finished = timezone.now()
+    job.save()
+    return True
+
+
+def work(*, batch: int = 10, idle: float = 1.0, once: bool = False) -> int:
+    total = 0
+    while True:
+        jobs = claim(batch)
+        for job in jobs:
+            total += run(job)
+        if once and not jobs:
+            return total
+        if not jobs:
+            time.sleep(idle)
+
+
+def report(*, hours: int = 1) -> dict:
+    now = timezone.now()
+    depth = dict(
+        Job.objects.values_list("status").annotate(count=Count("id")).order_by()
+    )
+    recent = Job.objects.filter(started__gte=now - timedelta(hours=hours))
+    stats = recent.aggregate(
+        latency=Avg(F("started") - F("run_at")),
+        runtime=Avg(F("finished") - F("started")),
+    )
+    oldest = Job.objects.filter(status=Job.Status.QUEUED, run_at__lte=now).aggregate(
+        oldest=Min("run_at")
+    )["oldest"]
+    expired = now - timedelta(seconds=settings.JOBS_LEASE)
+    return {
+        "depth": {status: depth.get(status, 0) for status in Job.Status.values},
+        "stale": Job.objects.filter(
+            status=Job.Status.RUNNING, started__lt=expired
+        ).count(),
+        "oldest": (now - oldest).total_seconds() if oldest else 0.0,
+        "latency": stats["latency"].total_seconds() if stats["latency"] else 0.0,
+        "runtime": stats["runtime"].total_seconds() if stats["runtime"] else 0.0,
+    }
+
+
+def purge(*, days: int = 7) -> int:
+    age = timezone.now() - timedelta(days=days)
+    count, _ = Job.objects.filter(
+        status__in=[Job.Status.DONE, Job.Status.FAILED], finished__lte=age
+    ).delete()
+    return count
@@ -0,0 +1,16 @@
+import asyncio
+
+from django.core.management.base import BaseCommand
+
+from ballotbuddies.explore import helpers
+from ballotbuddies.explore.models import Item
+
+
+class Command(BaseCommand):
+    help = "Rebuild the local search index for active elections"
+
+    def handle(self, **_options):
+        items = asyncio.run(helpers.get_index_items())
+        count = Item.objects.rebuild(items)
+        s = "" if count == 1 else "s"
+        self.stdout.write(f"Indexed {count} item{s}")
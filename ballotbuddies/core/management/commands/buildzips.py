@@ -0,0 +1,19 @@
+from django.core.management.base import BaseCommand
+
+import us
+import zipcodes
+
+from ballotbuddies.buddies.geography import ZIP_STATES, build_zip_states
+
+
+class Command(BaseCommand):
+    help = "Regenerate the ZIP code to state lookup table"
+
+    def handle(self, **_options):
+        places = []
+        for place in zipcodes.list_all():
+            if state := us.states.lookup(place["state"]):
+                places.append((place["zip_code"], state.name))
+        data = build_zip_states(places)
+        ZIP_STATES.write_bytes(data)
+        self.stdout.write(f"Wrote {len(places)} ZIP codes to {ZIP_STATES}")
@@ -2,12 +2,17 @@ from django.core.management.base import BaseCommand
 
 from ballotbuddies.alerts import helpers as alerts
 from ballotbuddies.buddies import helpers as buddies
+from ballotbuddies.buddies.graph import index
+from ballotbuddies.core import jobs
 
 
 class Command(BaseCommand):
     help = "Clean up existing data"
 
     def handle(self, **_options):
-        buddies.update_neighbors()
-        buddies.update_statuses()
-        alerts.update_profiles()
+        with index.load():
+            buddies.update_neighbors()
+            buddies.update_statuses()
+            buddies.update_rankings()
+            alerts.update_profiles()
+        jobs.purge()
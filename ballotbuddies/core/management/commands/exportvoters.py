@@ -0,0 +1,26 @@
+from django.core.management.base import BaseCommand
+
+from ballotbuddies.buddies import export
+
+
+class Command(BaseCommand):
+    help = "Stream voter progress as CSV or JSONL"
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--format", dest="extension", choices=export.FORMATS, default="csv"
+        )
+        parser.add_argument("--state", default="")
+        parser.add_argument("--election", default="", help="Election date")
+        completion = parser.add_mutually_exclusive_group()
+        completion.add_argument("--complete", action="store_true", default=None)
+        completion.add_argument(
+            "--incomplete", action="store_false", dest="complete", default=None
+        )
+        parser.add_argument("--chunk-size", type=int, default=2000)
+
+    def handle(self, extension, state, election, complete, chunk_size, **_options):
+        query = export.filter_voters(state=state, election=election, complete=complete)
+        _content_type, render_rows = export.FORMATS[extension]
+        for line in render_rows(export.iter_rows(query, chunk_size=chunk_size)):
+            self.stdout.write(line, ending="")
@@ -9,7 +9,8 @@ from django.core.management.base import BaseCommand
 from django.db.utils import IntegrityError
 from django.utils import timezone
 
-from ballotbuddies.buddies import constants
+from ballotbuddies.buddies import constants, recommend
+from ballotbuddies.buddies.graph import index
 from ballotbuddies.buddies.models import Voter
 
 STATUS = {
@@ -95,14 +96,18 @@ class Command(BaseCommand):
                 str(_voter.zip_code),
                 status=status,
             )
-            voter.friends.add(friend, *real_voters, *test_voters)
+            others = [other for other in real_voters if other != voter]
+            voter.friends.add(friend, *others, *test_voters)
             voter.save()
 
-        for voter in Voter.objects.all():
-            voter.share_status()
-            if count := voter.update_neighbors():
-                self.stdout.write(f"Recommended {count} friend(s) to {voter}")
-                voter.save()
+        with index.load():
+            for voter in Voter.objects.all():
+                voter.share_status()
+            recommendations = recommend.update_neighbors()
+
+        for voter in Voter.objects.filter(pk__in=recommendations):
+            count = len(recommendations[voter.pk])
+            self.stdout.write(f"Recommended {count} friend(s) to {voter}")
 
     def update_site(self):
         site = Site.objects.get(id=1)
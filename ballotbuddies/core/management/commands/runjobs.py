@@ -0,0 +1,38 @@
+from django.conf import settings
+from django.core.management.base import BaseCommand
+
+from ballotbuddies.core import jobs
+
+
+class Command(BaseCommand):
+    help = "Process queued background jobs"
+
+    def add_arguments(self, parser):
+        parser.add_argument("--batch", type=int, default=10)
+        parser.add_argument("--once", action="store_true")
+        parser.add_argument("--report", action="store_true")
+
+    def handle(self, batch, once, report, **_options):
+        if report:
+            stats = jobs.report()
+            depth = ", ".join(f"{k}={v}" for k, v in stats["depth"].items())
+            self.stdout.write(f"Queue depth: {depth}")
+            self.stdout.write(f"Oldest queued job: {stats['oldest']:.1f}s")
+            self.stdout.write(f"Average latency: {stats['latency']:.1f}s")
+            self.stdout.write(f"Average runtime: {stats['runtime']:.1f}s")
+            if stats["stale"]:
+                self.stderr.write(
+                    self.style.WARNING(f"{stats['stale']} job(s) exceeded their lease")
+                )
+            if stats["oldest"] > settings.JOBS_LEASE:
+                self.stderr.write(
+                    self.style.ERROR(
+                        "Queued jobs are not being processed: "
+                        "is the 'worker' process running?"
+                    )
+                )
+            return
+
+        count = jobs.work(batch=batch, once=once)
+        s = "" if count == 1 else "s"
+        self.stdout.write(f"Completed {count} job{s}")
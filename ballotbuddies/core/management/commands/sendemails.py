@@ -8,8 +8,9 @@ class Command(BaseCommand):
 
     def add_arguments(self, parser):
         parser.add_argument("day", nargs="?")
+        parser.add_argument("--connections", type=int, default=1)
 
-    def handle(self, day, **_options):
-        count = alerts.send_activity_emails(day)
+    def handle(self, day, connections, **_options):
+        count = alerts.send_activity_emails(day, connections=connections)
         s = "" if count == 1 else "s"
         self.stdout.write(f"Sent {count} email{s}")
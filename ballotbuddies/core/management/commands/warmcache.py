@@ -0,0 +1,28 @@
+import asyncio
+
+from django.core.management.base import BaseCommand
+
+import log
+
+from ballotbuddies.explore import constants, helpers
+
+
+class Command(BaseCommand):
+    help = "Prefetch explore pages for active elections into the cache"
+
+    def add_arguments(self, parser):
+        parser.add_argument("--concurrency", type=int, default=constants.CONCURRENCY)
+
+    def handle(self, concurrency, **_options):
+        try:
+            rate = asyncio.run(self.warm(concurrency))
+        except Exception as e:  # pylint: disable=broad-except
+            log.error(f"Unable to warm explore cache: {e!r}")
+        else:
+            self.stdout.write(f"Cache hit rate while warming: {rate:.0%}")
+
+    async def warm(self, concurrency: int) -> float:
+        try:
+            return await helpers.warm_cache(concurrency)
+        finally:
+            await helpers.close_client()
@@ -1,9 +1,9 @@
 # pylint: disable=access-member-before-definition,attribute-defined-outside-init
 
-from time import time
-
-from django.contrib.auth import update_session_auth_hash
 from django.contrib.auth.models import User
+from django.db import models
+from django.db.models import Q
+from django.utils import timezone
 
 
 def normalize(name: str) -> str:
@@ -19,13 +19,11 @@ class CustomUser:
     def is_test(self: User) -> bool:  # type: ignore
         return "admin" in self.username or self.voter.zip_code == "99999"
 
-    def update_name(self: User, request, first_name: str, last_name: str):  # type: ignore
+    def update_name(self: User, first_name: str, last_name: str):  # type: ignore
         self.first_name = first_name
         self.last_name = last_name
         if not self.is_superuser:  # preserve default localhost user
             self.username = f"{self.get_full_name()} ({self.email})"
-            self.set_password(str(int(time())))
-            update_session_auth_hash(request, self)
         self.save()
 
 
@@ -33,3 +31,46 @@ for _name in dir(CustomUser):
     if not _name.startswith("_"):
         method = getattr(CustomUser, _name)
         User.add_to_class(_name, method)
+
+
+class Job(models.Model):
+    class Status(models.TextChoices):
+        QUEUED = "queued"
+        RUNNING = "running"
+        DONE = "done"
+        FAILED = "failed"
+
+    name = models.CharField(max_length=100)
+    key = models.CharField(max_length=200, blank=True)
+    kwargs = models.JSONField(blank=True, default=dict)
+
+    status = models.CharField(
+        max_length=10, choices=Status.choices, default=Status.QUEUED
+    )
+    attempts = models.PositiveIntegerField(default=0)
+    error = models.TextField(blank=True)
+
+    created = models.DateTimeField(auto_now_add=True)
+    run_at = models.DateTimeField(default=timezone.now)
+    started = models.DateTimeField(null=True, blank=True)
+    finished = models.DateTimeField(null=True, blank=True)
+
+    class Meta:
+        ordering = ["run_at"]
+        indexes = [models.Index(fields=["status", "run_at"])]
+        constraints = [
+            models.UniqueConstraint(
+                fields=["key"],
+                condition=Q(status__in=["queued", "running"]) & ~Q(key=""),
+                name="unique_pending_job_key",
+            )
+        ]
+
+    def __str__(self):
+        return f"{self.name}({self.key or self.pk})"
+
+    @property
+    def latency(self) -> float | None:
+        if self.started:
+            return (self.started - self.run_at).total_seconds()
+        return None
@@ -23,3 +23,8 @@ def abbreviate(value: str):
         return value
     except (ValueError, TypeError):
         return value
+
+
+@register.filter
+def relationship(voter, user) -> str:
+    return "self" if getattr(voter, "user", None) == user else "other"
@@ -0,0 +1,83 @@
+# pylint: disable=expression-not-assigned,singleton-comparison,unused-variable
+
+import pytest
+
+from .. import jobs
+from ..models import Job
+
+calls: list[int] = []
+
+
+@jobs.task(retries=1, backoff=0)
+def record(value: int):
+    if value < 0:
+        raise ValueError("negative")
+    calls.append(value)
+
+
+@pytest.fixture(autouse=True)
+def queue(settings):
+    settings.JOBS_EAGER = False
+    calls.clear()
+
+
+def describe_task():
+    def it_registers_by_app_and_function_name(expect):
+        expect(jobs.get_task("tests.record").function).is_(record)
+
+
+def describe_enqueue():
+    def it_runs_immediately_when_eager(expect, settings):
+        settings.JOBS_EAGER = True
+
+        job = jobs.enqueue("tests.record", value=1)
+
+        expect(job) == None
+        expect(calls) == [1]
+
+    @pytest.mark.django_db
+    def it_skips_duplicate_pending_keys(expect):
+        job = jobs.enqueue("tests.record", key="record:1", value=1)
+
+        expect(jobs.enqueue("tests.record", key="record:1", value=2)) == job
+        expect(Job.objects.count()) == 1
+
+
+def describe_work():
+    @pytest.mark.django_db
+    def it_runs_queued_jobs(expect):
+        jobs.enqueue("tests.record", value=1)
+        jobs.enqueue("tests.record", value=2)
+
+        expect(jobs.work(once=True)) == 2
+        expect(sorted(calls)) == [1, 2]
+        expect(jobs.report()["depth"]["done"]) == 2
+
+    @pytest.mark.django_db
+    def it_retries_failed_jobs(expect):
+        job = jobs.enqueue("tests.record", key="record:-1", value=-1)
+        assert job
+
+        expect(jobs.work(once=True)) == 0
+
+        job.refresh_from_db()
+        expect(job.status) == Job.Status.FAILED
+        expect(job.attempts) == 2
+        expect(job.error) == "ValueError: negative"
+
+    @pytest.mark.django_db
+    def it_reclaims_jobs_with_expired_leases(expect, settings):
+        job = jobs.enqueue("tests.record", value=3)
+        assert job
+
+        expect(jobs.claim()) == [job]
+        expect(jobs.claim()) == []
+        expect(jobs.report()["stale"]) == 0
+
+        settings.JOBS_LEASE = -1
+        expect(jobs.report()["stale"]) == 1
+        expect(jobs.work(once=True)) == 1
+        expect(calls) == [3]
+
+        job.refresh_from_db()
+        expect(job.attempts) == 2
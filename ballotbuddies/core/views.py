@@ -51,12 +51,11 @@ def join(request: HttpRequest):
                 voter = Voter.objects.from_email(email, referrer)
                 voter.birth_date = form.cleaned_data["birth_date"]
                 voter.zip_code = form.cleaned_data["zip_code"]
-                voter.save()
                 voter.user.update_name(  # type: ignore
-                    request,
                     form.cleaned_data["first_name"],
                     form.cleaned_data["last_name"],
                 )
+                voter.save()
                 log.info(f"Updated voter: {voter}")
             else:
                 log.info(f"Voter already exists: {voter}")
@@ -0,0 +1,171 @@
+from __future__ import annotations
+
+import asyncio
+import json
+import threading
+import zlib
+from collections import Counter, OrderedDict
+from time import time
+from typing import Any, Awaitable, Callable, NamedTuple
+
+from django.core.cache import caches
+
+import log
+
+from . import constants
+
+
+class Entry(NamedTuple):
+    data: bytes
+    fresh_until: float
+    size: int
+
+    @property
+    def fresh(self) -> bool:
+        return time() < self.fresh_until
+
+
+class MemoryCache:
+    """In-process LRU of serialized values bounded by their total size."""
+
+    def __init__(self, max_bytes: int):
+        self.max_bytes = max_bytes
+        self.size = 0
+        self._entries: OrderedDict[str, Entry] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def get(self, key: str) -> Entry | None:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry:
+                self._entries.move_to_end(key)
+            return entry
+
+    def set(self, key: str, entry: Entry):
+        if entry.size > self.max_bytes:
+            return
+        with self._lock:
+            if previous := self._entries.pop(key, None):
+                self.size -= previous.size
+            self._entries[key] = entry
+            self.size += entry.size
+            while self.size > self.max_bytes:
+                _key, evicted = self._entries.popitem(last=False)
+                self.size -= evicted.size
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+            self.size = 0
+
+
+class TieredCache:
+    """Memory in front of a shared cache with stale-while-revalidate reads.
+
+    Entries are fresh for the shared cache's default timeout and then served
+    stale for up to `stale_timeout` seconds while a single background request
+    refreshes them. Concurrent misses on the same key share one request.
+    Every caller decodes its own copy, so results can be modified freely.
+    """
+
+    def __init__(self, alias: str, *, max_bytes: int, stale_timeout: int):
+        self.alias = alias
+        self.memory = MemoryCache(max_bytes)
+        self.stale_timeout = stale_timeout
+        self._inflight: dict[str, asyncio.Future] = {}
+        self._refreshing: set[asyncio.Task] = set()
+        self.stats: Counter[str] = Counter()
+
+    @property
+    def shared(self):
+        return caches[self.alias]
+
+    async def get(self, key: str, fetch: Callable[[], Awaitable[Any]]) -> Any:
+        entry = self.memory.get(key)
+        if entry:
+            self.stats["memory_hits"] += 1
+        elif envelope := await self.shared.aget(key):
+            self.stats["shared_hits"] += 1
+            fresh_until, payload = envelope
+            raw = zlib.decompress(payload)
+            entry = Entry(raw, fresh_until, len(raw))
+            self.memory.set(key, entry)
+
+        if entry is None:
+            self.stats["misses"] += 1
+            return await self._fetch(key, fetch)
+        if not entry.fresh and key not in self._inflight:
+            log.debug(f"Serving stale {key} while refreshing")
+            self.stats["stale_hits"] += 1
+            task = asyncio.create_task(self._fetch(key, fetch))
+            self._refreshing.add(task)
+            task.add_done_callback(self._refreshed)
+        return json.loads(entry.data)
+
+    async def set(self, key: str, data: Any) -> bytes:
+        raw = json.dumps(data, separators=(",", ":")).encode()
+        payload = zlib.compress(raw, constants.COMPRESSION_LEVEL)
+        self.stats["raw_bytes"] += len(raw)
+        self.stats["stored_bytes"] += len(payload)
+        log.debug(f"Caching {key}: {len(raw)} bytes compressed to {len(payload)}")
+
+        timeout = self.shared.default_timeout
+        if timeout is None:
+            fresh_until = float("inf")
+        else:
+            fresh_until = time() + timeout
+            timeout += self.stale_timeout
+        self.memory.set(key, Entry(raw, fresh_until, len(raw)))
+        await self.shared.aset(key, (fresh_until, payload), timeout)
+        return raw
+
+    def report(self) -> dict[str, int | float]:
+        stats: dict[str, int | float] = dict(self.stats)
+        stats["memory_entries"] = len(self.memory)
+        stats["memory_bytes"] = self.memory.size
+        if self.stats["stored_bytes"]:
+            ratio = self.stats["raw_bytes"] / self.stats["stored_bytes"]
+            stats["compression_ratio"] = round(ratio, 1)
+        return stats
+
+    def clear(self):
+        """Drop in-process entries; the shared cache may hold other data."""
+        self.memory.clear()
+        self.stats.clear()
+
+    async def _fetch(self, key: str, fetch: Callable[[], Awaitable[Any]]) -> Any:
+        if future := self._inflight.get(key):
+            return json.loads(await asyncio.shield(future))
+
+        future = asyncio.get_running_loop().create_future()
+        self._inflight[key] = future
+        try:
+            data = await fetch()
+            raw = await self.set(key, data)
+        except asyncio.CancelledError:
+            future.cancel()
+            raise
+        except Exception as e:
+            future.set_exception(e)
+            future.exception()  # mark retrieved when nobody else is waiting
+            raise
+        else:
+            future.set_result(raw)
+            return data
+        finally:
+            del self._inflight[key]
+
+    def _refreshed(self, task: asyncio.Task):
+        self._refreshing.discard(task)
+        if not task.cancelled() and (error := task.exception()):
+            log.warning(f"Background refresh failed: {error}")
+
+
+cache = TieredCache(
+    "explore",
+    max_bytes=constants.MEMORY_CACHE_BYTES,
+    stale_timeout=constants.STALE_TIMEOUT,
+)
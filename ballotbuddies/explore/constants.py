@@ -1,6 +1,48 @@
+import os
+from importlib.util import find_spec
+
 from django.conf import settings
 
 if getattr(settings, "TEST", False):
     LIMIT = 20
 else:
     LIMIT = 0
+
+HTTP2 = find_spec("h2") is not None
+MAX_CONNECTIONS = int(os.getenv("EXPLORE_MAX_CONNECTIONS", "20"))
+MAX_KEEPALIVE_CONNECTIONS = int(os.getenv("EXPLORE_MAX_KEEPALIVE_CONNECTIONS", "10"))
+KEEPALIVE_EXPIRY = 30
+TIMEOUT = 10
+
+PAGE_SIZE = int(os.getenv("EXPLORE_PAGE_SIZE", "250"))
+CONCURRENCY = int(os.getenv("EXPLORE_CONCURRENCY", "4"))
+DEADLINE = 10
+
+MEMORY_CACHE_BYTES = int(os.getenv("EXPLORE_MEMORY_CACHE_BYTES", str(32 * 1024**2)))
+STALE_TIMEOUT = 60 * 60 * 24
+COMPRESSION_LEVEL = 6
+INDEX_LIMIT = 10_000
+WARM_LIMITS = [0, 20, INDEX_LIMIT]
+WARM_ON_BOOT = bool(os.getenv("EXPLORE_WARM_ON_BOOT"))
+
+PROPOSAL_FIELDS: dict = {
+    "id": True,
+    "name": True,
+    "description": True,
+    "election": {"id": True, "name": True, "date": True},
+    "district": {"id": True, "name": True, "category": True},
+}
+POSITION_FIELDS: dict = {
+    "id": True,
+    "name": True,
+    "section": True,
+    "description": True,
+    "seats": True,
+    "candidates": {
+        "name": True,
+        "party": {"name": True, "color": True},
+        "nomination": {"name": True, "color": True},
+    },
+    "election": PROPOSAL_FIELDS["election"],
+    "district": PROPOSAL_FIELDS["district"],
+}
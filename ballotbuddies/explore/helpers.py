@@ -1,116 +1,288 @@
+import asyncio
 from time import time
-
-from django.core.cache import caches
+from typing import AsyncIterator
+from weakref import WeakKeyDictionary
 
 import httpx
 import log
+from asgiref.sync import sync_to_async
+
+from . import constants
+from .cache import cache
+from .models import Item
 
 API = "https://michiganelections.io/api"
 
-cache = caches["explore"]
+_clients: WeakKeyDictionary[asyncio.AbstractEventLoop, httpx.AsyncClient]
+_clients = WeakKeyDictionary()
+
+
+def get_client() -> httpx.AsyncClient:
+    loop = asyncio.get_running_loop()
+    client = _clients.get(loop)
+    if client is None or client.is_closed:
+        log.debug(f"Opening elections API client: {constants.HTTP2=}")
+        client = httpx.AsyncClient(
+            follow_redirects=True,
+            http2=constants.HTTP2,
+            limits=httpx.Limits(
+                max_connections=constants.MAX_CONNECTIONS,
+                max_keepalive_connections=constants.MAX_KEEPALIVE_CONNECTIONS,
+                keepalive_expiry=constants.KEEPALIVE_EXPIRY,
+            ),
+            timeout=constants.TIMEOUT,
+        )
+        _clients[loop] = client
+    return client
+
+
+async def close_client():
+    loop = asyncio.get_running_loop()
+    if client := _clients.pop(loop, None):
+        log.debug("Closing elections API client")
+        await client.aclose()
 
 
 async def get_election(election_id: int) -> dict:
     url = f"{API}/elections/{election_id}/"
-    async with httpx.AsyncClient() as client:
-        data = await _call(client, url)
-        return data
+    return await _call(get_client(), url)
 
 
 async def get_district(district_id: int) -> dict:
     url = f"{API}/districts/{district_id}/"
-    async with httpx.AsyncClient() as client:
-        data = await _call(client, url)
-        return data
+    return await _call(get_client(), url)
+
+
+async def get_election_and_district(
+    election_id: int, district_id: int
+) -> tuple[dict | None, dict | None]:
+    election, district = await asyncio.gather(
+        get_election(election_id) if election_id else _skip(),
+        get_district(district_id) if district_id else _skip(),
+    )
+    return election, district
 
 
 async def get_proposals(
     q: str, limit: int, *, election_id: int = 0, district_id: int = 0
 ) -> tuple[int, list]:
-    total = 0
-    items: list[dict] = []
-
     log.info(f"Getting proposals: {election_id=} {district_id=} {q=} {limit=}")
-    url = f"{API}/proposals/?q={q}"
-    url += "&limit=1000" if limit else "&limit=1"
-    if election_id:
-        url += f"&election_id={election_id}"
-    if district_id:
-        url += f"&district_id={district_id}"
-
-    start = time()
-    async with httpx.AsyncClient(follow_redirects=True) as client:
-        while url:
-            data = await _call(client, url)
-            total = data["count"]
-            items.extend(data["results"])
-            url = data["next"]
-
-            if len(items) >= limit:
-                s = "" if len(items) == 1 else "s"
-                log.info(f"Stopped fetching after {len(items)} item{s}")
-                break
-
-            elapsed = round(time() - start, 1)
-            if elapsed > 10:
-                log.info(f"Stopped fetching after {elapsed} seconds timeout")
-                break
-
-    return total, items
+    if result := await _search("proposals", q, limit, election_id, district_id):
+        return result
+    url = _build_url("proposals", q, election_id, district_id)
+    return await _collect(url, limit, constants.PROPOSAL_FIELDS)
 
 
 async def get_positions(
     q: str, limit: int, *, election_id: int = 0, district_id: int = 0
 ) -> tuple[int, list]:
-    total = 0
-    items: list[dict] = []
+    log.info(f"Getting positions: {election_id=} {district_id=} {q=} {limit=}")
+    if result := await _search("positions", q, limit, election_id, district_id):
+        return result
+    url = _build_url("positions", q, election_id, district_id)
+    return await _collect(url, limit, constants.POSITION_FIELDS)
 
-    log.info(f"Getting {limit} positions: {election_id=} {district_id=} {q=} {limit=}")
-    url = f"{API}/positions/?q={q}"
-    url += "&limit=1000" if limit else "&limit=1"
-    if election_id:
-        url += f"&election_id={election_id}"
-    if district_id:
-        url += f"&district_id={district_id}"
 
-    start = time()
-    async with httpx.AsyncClient(follow_redirects=True) as client:
-        while url:
-            data = await _call(client, url)
-            total = data["count"]
-            items.extend(data["results"])
-            url = data["next"]
-
-            if len(items) >= limit:
-                s = "" if len(items) == 1 else "s"
-                log.info(f"Stopped fetching after {len(items)} item{s}")
-                break
-
-            elapsed = round(time() - start, 1)
-            if elapsed > 10:
-                log.info(f"Stopped fetching after {elapsed} seconds timeout")
-                break
+async def iter_pages(
+    url: str,
+    limit: int,
+    fields: dict | None = None,
+    *,
+    semaphore: asyncio.Semaphore | None = None,
+) -> AsyncIterator[tuple[int, int, list]]:
+    """Yield (total, offset, results) for each page as it arrives."""
+    client = get_client()
+    semaphore = semaphore or asyncio.Semaphore(constants.CONCURRENCY)
+    size = min(limit, constants.PAGE_SIZE) or 1
+    async with semaphore:
+        data = await _call(client, f"{url}&limit={size}", fields)
+    total = data["count"]
+    yield total, 0, data["results"]
 
-    return total, items
+    stop = min(total, limit)
+    offsets = range(size, stop, constants.PAGE_SIZE)
+    if not offsets:
+        return
+
+    async def fetch(offset: int) -> tuple[int, list]:
+        async with semaphore:
+            size = min(constants.PAGE_SIZE, stop - offset)
+            data = await _call(client, f"{url}&limit={size}&offset={offset}", fields)
+            return offset, data["results"]
+
+    tasks = [asyncio.create_task(fetch(offset)) for offset in offsets]
+    missing = set(offsets)
+    try:
+        for task in asyncio.as_completed(tasks, timeout=constants.DEADLINE):
+            offset, results = await task
+            missing.discard(offset)
+            yield total, offset, results
+    except TimeoutError:
+        log.warning(
+            f"Fetching {len(missing)} remaining page(s) sequentially"
+            f" after {constants.DEADLINE} seconds timeout"
+        )
+    finally:
+        for task in tasks:
+            task.cancel()
+
+    for offset in sorted(missing):
+        offset, results = await fetch(offset)
+        yield total, offset, results
 
 
 async def get_elections() -> tuple[int, list]:
     log.info("Getting elections")
     url = f"{API}/elections/"
-    async with httpx.AsyncClient(follow_redirects=True) as client:
-        data = await _call(client, url)
-        total = data["count"]
-        url = data["next"]
-        items = data["results"]
+    data = await _call(get_client(), url)
+    total = data["count"]
+    items = data["results"]
+
+    return total, items
 
+
+async def get_index_items() -> list[Item]:
+    _total, elections = await get_elections()
+    active = [election["id"] for election in elections if election["active"]]
+    log.info(f"Indexing active elections: {active}")
+
+    results: dict[tuple[str, int], Item] = {}
+    for kind, fields in [
+        (Item.Kind.PROPOSAL, constants.PROPOSAL_FIELDS),
+        (Item.Kind.POSITION, constants.POSITION_FIELDS),
+    ]:
+        for election_id in active:
+            url = _build_url(kind, "", election_id, 0)
+            total, items = await _collect(url, constants.INDEX_LIMIT, fields)
+            if len(items) < total:
+                log.warning(f"Indexed only {len(items)} of {total} {kind}")
+            for item in items:
+                results[kind, item["id"]] = Item.from_data(kind, len(results), item)
+    return list(results.values())
+
+
+async def warm_cache(concurrency: int = constants.CONCURRENCY) -> float:
+    """Prefetch election pages and report the cache hit rate while warming."""
+    start = cache.stats.copy()
+    try:
+        await _warm(concurrency)
+    except Exception as e:  # pylint: disable=broad-except
+        log.warning(f"Unable to warm explore cache: {e!r}")
+    rate = _hit_rate(cache.stats - start)
+    log.info(f"Warmed explore cache: {rate:.0%} hit rate")
+    return rate
+
+
+def project(value, fields: dict | bool):
+    if fields is True:
+        return value
+    if isinstance(value, list):
+        return [project(item, fields) for item in value]
+    if isinstance(value, dict):
+        return {
+            key: project(value[key], spec)
+            for key, spec in fields.items()  # type: ignore[union-attr]
+            if key in value
+        }
+    return value
+
+
+async def _warm(concurrency: int):
+    semaphore = asyncio.Semaphore(concurrency)
+
+    async def bounded(coroutine):
+        async with semaphore:
+            return await coroutine
+
+    _total, elections = await get_elections()
+    active = [election["id"] for election in elections if election["active"]]
+    requests = [bounded(get_election(election_id)) for election_id in active]
+    for kind, fields in [
+        ("proposals", constants.PROPOSAL_FIELDS),
+        ("positions", constants.POSITION_FIELDS),
+    ]:
+        for election_id in active:
+            url = _build_url(kind, "", election_id, 0)
+            for limit in constants.WARM_LIMITS:
+                requests.append(_collect(url, limit, fields, semaphore=semaphore))
+    results = await asyncio.gather(*requests)
+
+    districts = {
+        item["district"]["id"]
+        for result in results
+        if isinstance(result, tuple)
+        for item in result[1]
+    }
+    await asyncio.gather(*(bounded(get_district(pk)) for pk in sorted(districts)))
+
+
+def _hit_rate(stats) -> float:
+    hits = stats["memory_hits"] + stats["shared_hits"]
+    total = hits + stats["misses"]
+    return round(hits / total, 2) if total else 0.0
+
+
+async def _search(
+    kind: str, q: str, limit: int, election_id: int, district_id: int
+) -> tuple[int, list] | None:
+    if not election_id:
+        return None
+    result = await sync_to_async(Item.objects.search)(
+        kind, q, limit, election_id=election_id, district_id=district_id
+    )
+    if result:
+        log.info(f"Found {result[0]} {kind} in local index")
+    return result
+
+
+async def _collect(
+    url: str,
+    limit: int,
+    fields: dict,
+    *,
+    semaphore: asyncio.Semaphore | None = None,
+) -> tuple[int, list]:
+    """Reassemble pages in offset order for templates that need every item.
+
+    The result lists place their infinite scroll trigger relative to the end
+    of the page and compare the item count to the limit, so rendering waits
+    for the concurrent fetches instead of streaming partial pages.
+    """
+    total = 0
+    pages: dict[int, list] = {}
+    start = time()
+    async for total, offset, results in iter_pages(
+        url, limit, fields, semaphore=semaphore
+    ):
+        pages[offset] = results
+    items = [item for offset in sorted(pages) for item in pages[offset]]
+
+    elapsed = round(time() - start, 1)
+    s = "" if len(items) == 1 else "s"
+    log.info(f"Fetched {len(items)} item{s} in {len(pages)} page(s) in {elapsed}s")
     return total, items
 
 
-async def _call(client, url: str) -> dict:
-    data = await caches["explore"].aget(url)
-    if data is None:
+def _build_url(path: str, q: str, election_id: int, district_id: int) -> str:
+    url = f"{API}/{path}/?q={q}"
+    if election_id:
+        url += f"&election_id={election_id}"
+    if district_id:
+        url += f"&district_id={district_id}"
+    return url
+
+
+async def _call(client, url: str, fields: dict | None = None) -> dict:
+    async def fetch() -> dict:
         log.info(f"Fetching {url}")
-        response = await client.get(url, timeout=10)
+        response = await client.get(url)
         data = response.json()
-        await caches["explore"].aset(url, data)
-    return data
+        if fields:
+            data["results"] = project(data["results"], fields)
+        return data
+
+    return await cache.get(url, fetch)
+
+
+async def _skip() -> None:
+    return None
@@ -0,0 +1,61 @@
+# Generated by Django 5.0.14 on 2026-10-18 19:42
+
+import django.contrib.postgres.indexes
+import django.contrib.postgres.search
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    initial = True
+
+    dependencies = []
+
+    operations = [
+        migrations.CreateModel(
+            name="Item",
+            fields=[
+                (
+                    "id",
+                    models.AutoField(
+                        auto_created=True,
+                        primary_key=True,
+                        serialize=False,
+                        verbose_name="ID",
+                    ),
+                ),
+                (
+                    "kind",
+                    models.CharField(
+                        choices=[("proposals", "Proposal"), ("positions", "Position")],
+                        max_length=10,
+                    ),
+                ),
+                ("remote_id", models.PositiveIntegerField()),
+                ("election_id", models.PositiveIntegerField()),
+                ("district_id", models.PositiveIntegerField()),
+                ("order", models.PositiveIntegerField(default=0)),
+                ("name", models.TextField()),
+                ("body", models.TextField(blank=True)),
+                ("data", models.JSONField()),
+                ("search", django.contrib.postgres.search.SearchVectorField(null=True)),
+            ],
+            options={
+                "ordering": ["order"],
+                "indexes": [
+                    models.Index(
+                        fields=["kind", "election_id", "district_id"],
+                        name="explore_ite_kind_af4e87_idx",
+                    ),
+                    django.contrib.postgres.indexes.GinIndex(
+                        fields=["search"], name="explore_ite_search_b68ab0_gin"
+                    ),
+                ],
+            },
+        ),
+        migrations.AddConstraint(
+            model_name="item",
+            constraint=models.UniqueConstraint(
+                fields=("kind", "remote_id"), name="unique_explore_item"
+            ),
+        ),
+    ]
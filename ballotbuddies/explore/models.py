@@ -0,0 +1,111 @@
+import re
+
+from django.contrib.postgres.indexes import GinIndex
+from django.contrib.postgres.search import (
+    SearchQuery,
+    SearchRank,
+    SearchVector,
+    SearchVectorField,
+)
+from django.db import models, transaction
+
+import log
+
+TERM = re.compile(r"(-?)(\w+)")
+
+
+def to_tsquery(q: str) -> str:
+    terms = []
+    for negate, word in TERM.findall(q.lower()):
+        terms.append(f"{'!' if negate else ''}{word}:*")
+    return " & ".join(terms)
+
+
+class ItemManager(models.Manager["Item"]):
+    def rebuild(self, items: list["Item"]) -> int:
+        with transaction.atomic():
+            self.all().delete()
+            self.bulk_create(items, batch_size=1000)
+            self.update(
+                search=SearchVector("name", weight="A", config="english")
+                + SearchVector("body", weight="B", config="english")
+            )
+        log.info(f"Indexed {len(items)} explore item(s)")
+        return len(items)
+
+    def search(
+        self,
+        kind: str,
+        q: str,
+        limit: int,
+        *,
+        election_id: int = 0,
+        district_id: int = 0,
+    ) -> tuple[int, list[dict]] | None:
+        """Return matching items if the election has been indexed locally."""
+        query = self.filter(kind=kind, election_id=election_id)
+        if not query.exists():
+            return None
+        if district_id:
+            query = query.filter(district_id=district_id)
+        if tsquery := to_tsquery(q):
+            search = SearchQuery(tsquery, search_type="raw", config="english")
+            query = (
+                query.filter(search=search)
+                .annotate(rank=SearchRank("search", search))
+                .order_by("-rank", "order")
+            )
+
+        total = query.count()
+        items = [item.data for item in query.only("data")[: max(limit, 1)]]
+        return total, items
+
+
+class Item(models.Model):
+    class Kind(models.TextChoices):
+        PROPOSAL = "proposals"
+        POSITION = "positions"
+
+    objects = ItemManager()
+
+    kind = models.CharField(max_length=10, choices=Kind.choices)
+    remote_id = models.PositiveIntegerField()
+    election_id = models.PositiveIntegerField()
+    district_id = models.PositiveIntegerField()
+    order = models.PositiveIntegerField(default=0)
+
+    name = models.TextField()
+    body = models.TextField(blank=True)
+    data = models.JSONField()
+    search = SearchVectorField(null=True)
+
+    class Meta:
+        ordering = ["order"]
+        indexes = [
+            models.Index(fields=["kind", "election_id", "district_id"]),
+            GinIndex(fields=["search"]),
+        ]
+        constraints = [
+            models.UniqueConstraint(
+                fields=["kind", "remote_id"], name="unique_explore_item"
+            )
+        ]
+
+    def __str__(self):
+        return f"{self.kind}:{self.remote_id}"
+
+    @classmethod
+    def from_data(cls, kind: str, order: int, data: dict) -> "Item":
+        body = [data.get("section") or "", data.get("description") or ""]
+        body.extend(candidate["name"] for candidate in data.get("candidates", []))
+        body.append(data["district"]["name"])
+        return cls(
+            kind=kind,
+            remote_id=data["id"],
+            election_id=data["election"]["id"],
+            district_id=data["district"]["id"],
+            order=order,
+            name=data["name"],
+            body="\n".join(filter(None, body)),
+            data=data,
+        )
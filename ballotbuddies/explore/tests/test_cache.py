@@ -0,0 +1,113 @@
+# pylint: disable=expression-not-assigned,singleton-comparison,unused-variable
+
+import asyncio
+
+import pytest
+
+from ..cache import Entry, MemoryCache, TieredCache
+
+
+def describe_memory_cache():
+    def it_evicts_least_recently_used_entries_by_size(expect):
+        memory = MemoryCache(max_bytes=10)
+
+        memory.set("a", Entry(b"a", 0, 4))
+        memory.set("b", Entry(b"b", 0, 4))
+        memory.get("a")
+        memory.set("c", Entry(b"c", 0, 4))
+
+        expect(memory.get("b")) == None
+        entry = memory.get("a")
+        assert entry
+        expect(entry.data) == b"a"
+        expect(memory.size) == 8
+
+    def it_skips_values_larger_than_the_budget(expect):
+        memory = MemoryCache(max_bytes=10)
+
+        memory.set("a", Entry(b"a", 0, 11))
+
+        expect(len(memory)) == 0
+
+
+def describe_tiered_cache():
+    @pytest.fixture
+    def cache(settings):
+        settings.CACHES = {
+            **settings.CACHES,
+            "explore": {
+                "BACKEND": "django.core.cache.backends.locmem.LocMemCache",
+                "LOCATION": "test-explore",
+            },
+        }
+        cache = TieredCache("explore", max_bytes=1024, stale_timeout=60)
+        cache.shared.clear()
+        return cache
+
+    @pytest.fixture
+    def calls():
+        return []
+
+    @pytest.fixture
+    def fetch(calls):
+        async def fetch():
+            calls.append(len(calls))
+            await asyncio.sleep(0.01)
+            return {"count": len(calls)}
+
+        return fetch
+
+    def it_coalesces_concurrent_misses(expect, cache, calls, fetch):
+        async def run():
+            return await asyncio.gather(*(cache.get("url", fetch) for _ in range(5)))
+
+        results = asyncio.run(run())
+
+        expect(results) == [{"count": 1}] * 5
+        expect(len(calls)) == 1
+        expect(len({id(result) for result in results})) == 5
+
+    def it_returns_copies_from_memory(expect, cache, calls, fetch):
+        asyncio.run(cache.get("url", fetch))["count"] = 99
+
+        expect(asyncio.run(cache.get("url", fetch))) == {"count": 1}
+        expect(len(calls)) == 1
+
+    def it_clears_memory_without_touching_the_shared_cache(expect, cache, fetch):
+        asyncio.run(cache.get("url", fetch))
+        cache.shared.set("other", "value")
+
+        cache.clear()
+
+        expect(len(cache.memory)) == 0
+        expect(cache.shared.get("other")) == "value"
+        expect(cache.shared.get("url")) != None
+
+    def it_reads_through_the_shared_cache(expect, cache, calls, fetch):
+        asyncio.run(cache.get("url", fetch))
+        cache.memory.clear()
+
+        expect(asyncio.run(cache.get("url", fetch))) == {"count": 1}
+        expect(len(calls)) == 1
+
+    def it_serves_stale_entries_while_refreshing(expect, cache, calls, fetch):
+        async def run():
+            cache.memory.set("url", Entry(b'{"count":0}', 0, 11))
+            stale = await cache.get("url", fetch)
+            await asyncio.sleep(0.05)
+            return stale, await cache.get("url", fetch)
+
+        stale, fresh = asyncio.run(run())
+
+        expect(stale) == {"count": 0}
+        expect(fresh) == {"count": 1}
+        expect(len(calls)) == 1
+
+    def it_compresses_shared_entries(expect, cache):
+        data = {"results": [{"name": "Proposal", "description": "x" * 100}] * 10}
+
+        asyncio.run(cache.set("url", data))
+        fresh_until, payload = cache.shared.get("url")
+
+        expect(len(payload)) < 100
+        expect(cache.report()["compression_ratio"]) > 10
@@ -0,0 +1,137 @@
+# pylint: disable=expression-not-assigned,singleton-comparison,unused-variable
+
+import asyncio
+
+import pytest
+from furl import furl
+
+from .. import constants, helpers
+
+
+def describe_get_client():
+    def it_reuses_the_client_within_a_loop(expect):
+        async def run():
+            client = helpers.get_client()
+            reused = helpers.get_client() is client
+            await helpers.close_client()
+            return client, reused
+
+        client, reused = asyncio.run(run())
+
+        expect(reused) == True
+        expect(client.is_closed) == True
+
+    def it_skips_missing_ids(expect):
+        election, district = asyncio.run(helpers.get_election_and_district(0, 0))
+
+        expect(election) == None
+        expect(district) == None
+
+
+def describe_get_proposals():
+    @pytest.fixture
+    def urls(monkeypatch):
+        urls: list[str] = []
+
+        async def call(_client, url, _fields=None):
+            urls.append(url)
+            args = furl(url).args
+            offset = int(args.get("offset", 0))
+            limit = int(args["limit"])
+            await asyncio.sleep(0.01 if offset else 0.02)
+            return {
+                "count": 45,
+                "results": [{"id": i} for i in range(offset, min(offset + limit, 45))],
+            }
+
+        monkeypatch.setattr(constants, "PAGE_SIZE", 10)
+        monkeypatch.setattr(helpers, "_call", call)
+        return urls
+
+    def it_fetches_remaining_pages_in_order(expect, urls):
+        total, items = asyncio.run(helpers.get_proposals("", 100))
+
+        expect(total) == 45
+        expect([item["id"] for item in items]) == list(range(45))
+        expect(len(urls)) == 5
+
+    def it_stops_at_the_limit(expect, urls):
+        total, items = asyncio.run(helpers.get_proposals("", 25))
+
+        expect(total) == 45
+        expect(len(items)) == 25
+        expect(urls[-1]).endswith("&limit=5&offset=20")
+
+    @pytest.mark.usefixtures("urls")
+    def it_fetches_remaining_pages_sequentially_after_the_deadline(expect, monkeypatch):
+        monkeypatch.setattr(constants, "DEADLINE", 0.001)
+
+        total, items = asyncio.run(helpers.get_proposals("", 100))
+
+        expect(total) == 45
+        expect([item["id"] for item in items]) == list(range(45))
+
+    def it_fetches_a_single_item_to_count(expect, urls):
+        total, items = asyncio.run(helpers.get_proposals("", 0))
+
+        expect(total) == 45
+        expect(len(items)) == 1
+        expect(len(urls)) == 1
+
+
+def describe_project():
+    def it_keeps_only_rendered_fields(expect):
+        position = {
+            "id": 1,
+            "name": "Mayor",
+            "seats": 1,
+            "candidates": [
+                {"id": 2, "name": "Jane", "party": {"id": 3, "name": "Green"}},
+            ],
+            "election": {"id": 4, "name": "General", "date": "2024-11-05"},
+        }
+
+        expect(helpers.project(position, constants.POSITION_FIELDS)) == {
+            "id": 1,
+            "name": "Mayor",
+            "seats": 1,
+            "candidates": [{"name": "Jane", "party": {"name": "Green"}}],
+            "election": {"id": 4, "name": "General", "date": "2024-11-05"},
+        }
+
+
+def describe_warm_cache():
+    @pytest.fixture
+    def urls(monkeypatch):
+        urls: list[str] = []
+        pages = {
+            "elections": {"count": 1, "results": [{"id": 1, "active": True}]},
+            "proposals": {
+                "count": 1,
+                "results": [{"id": 2, "district": {"id": 3}}],
+            },
+            "positions": {"count": 0, "results": []},
+        }
+
+        async def call(_client, url, _fields=None):
+            urls.append(url)
+            path = furl(url).path.segments[1]
+            return pages.get(path, {})
+
+        monkeypatch.setattr(helpers, "_call", call)
+        return urls
+
+    def it_prefetches_active_elections_and_districts(expect, urls):
+        asyncio.run(helpers.warm_cache())
+
+        expect(urls).contains(f"{helpers.API}/elections/1/")
+        expect(urls).contains(f"{helpers.API}/districts/3/")
+        expect(urls).contains(f"{helpers.API}/positions/?q=&election_id=1&limit=20")
+
+    def it_logs_unexpected_errors(expect, monkeypatch):
+        async def call(_client, url, _fields=None):
+            raise KeyError("count")
+
+        monkeypatch.setattr(helpers, "_call", call)
+
+        expect(asyncio.run(helpers.warm_cache())) == 0.0
@@ -0,0 +1,67 @@
+# pylint: disable=expression-not-assigned,singleton-comparison,unused-variable
+
+import pytest
+
+from ..models import Item, to_tsquery
+
+
+def describe_to_tsquery():
+    def it_matches_prefixes(expect):
+        expect(to_tsquery("School Bond")) == "school:* & bond:*"
+
+    def it_excludes_negated_terms(expect):
+        expect(to_tsquery("millage -school")) == "millage:* & !school:*"
+
+    def it_ignores_punctuation(expect):
+        expect(to_tsquery("'); drop")) == "drop:*"
+        expect(to_tsquery("")) == ""
+
+
+@pytest.mark.django_db
+def describe_search():
+    @pytest.fixture
+    def items():
+        def proposal(pk, name, district_id=2):
+            return Item.from_data(
+                Item.Kind.PROPOSAL,
+                pk,
+                {
+                    "id": pk,
+                    "name": name,
+                    "description": "",
+                    "election": {"id": 1},
+                    "district": {"id": district_id, "name": "Detroit"},
+                },
+            )
+
+        Item.objects.rebuild(
+            [
+                proposal(1, "Library Millage"),
+                proposal(2, "School Bond"),
+                proposal(3, "Schoolcraft Road Millage", district_id=3),
+            ]
+        )
+
+    @pytest.mark.usefixtures("items")
+    def it_skips_elections_that_are_not_indexed(expect):
+        expect(Item.objects.search("proposals", "", 10, election_id=2)) == None
+
+    @pytest.mark.usefixtures("items")
+    def it_matches_prefixes(expect):
+        result = Item.objects.search("proposals", "schoo", 10, election_id=1)
+        assert result
+        total, results = result
+
+        expect(total) == 2
+        expect({item["id"] for item in results}) == {2, 3}
+
+    @pytest.mark.usefixtures("items")
+    def it_filters_by_district(expect):
+        result = Item.objects.search(
+            "proposals", "millage", 10, election_id=1, district_id=3
+        )
+        assert result
+        total, results = result
+
+        expect(total) == 1
+        expect(results[0]["name"]) == "Schoolcraft Road Millage"
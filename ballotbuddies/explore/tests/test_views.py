@@ -2,6 +2,8 @@
 
 from unittest.mock import AsyncMock, patch
 
+import pytest
+
 
 def describe_index():
     @patch(
@@ -14,6 +16,7 @@ def describe_index():
         expect(response.url).contains("proposals")
 
 
+@pytest.mark.django_db
 def describe_proposals():
     def it_shows_proposals_loading_message(expect, client):
         response = client.get("/explore/proposals/?limit=0")
@@ -46,6 +49,7 @@ def describe_proposals():
         expect(html.count("money")) == 12
 
 
+@pytest.mark.django_db
 def describe_positions():
     def it_shows_positions_loading_message(expect, client):
         response = client.get("/explore/positions/?limit=0")
@@ -52,19 +52,15 @@ async def _filter_proposals(
     limit = int(request.GET.get("limit", constants.LIMIT))
     banner = ""
 
-    if election_id:
-        election = await helpers.get_election(election_id)
+    election, district = await helpers.get_election_and_district(
+        election_id, district_id
+    )
+    if election:
         q = _normalize(q, election)
         banner = f"election_id={election_id}"
-    else:
-        election = None
-
-    if district_id:
-        district = await helpers.get_district(district_id)
+    if district:
         q = _normalize(q, district)
         banner = f"district_id={district_id}"
-    else:
-        district = None
 
     total, proposals = await helpers.get_proposals(
         q, limit, election_id=election_id, district_id=district_id
@@ -119,19 +115,15 @@ async def _filter_positions(
     limit = int(request.GET.get("limit", constants.LIMIT))
     banner = ""
 
-    if election_id:
-        election = await helpers.get_election(election_id)
+    election, district = await helpers.get_election_and_district(
+        election_id, district_id
+    )
+    if election:
         q = _normalize(q, election)
         banner = f"election_id={election_id}"
-    else:
-        election = None
-
-    if district_id:
-        district = await helpers.get_district(district_id)
+    if district:
         q = _normalize(q, district)
         banner = f"district_id={district_id}"
-    else:
-        district = None
 
     total, positions = await helpers.get_positions(
         q, limit, election_id=election_id, district_id=district_id
@@ -1,7 +1,37 @@
+import asyncio
 import os
 
 from django.core.asgi import get_asgi_application
 
 os.environ.setdefault("DJANGO_SETTINGS_MODULE", "config.settings.production")
 
-application = get_asgi_application()
+django_application = get_asgi_application()
+
+# pylint: disable=wrong-import-position
+from ballotbuddies.explore import constants, helpers
+
+tasks: set[asyncio.Task] = set()
+
+
+async def application(scope, receive, send):
+    if scope["type"] == "lifespan":
+        await lifespan(receive, send)
+    else:
+        await django_application(scope, receive, send)
+
+
+async def lifespan(receive, send):
+    while True:
+        message = await receive()
+        if message["type"] == "lifespan.startup":
+            if constants.WARM_ON_BOOT:
+                task = asyncio.create_task(helpers.warm_cache())
+                tasks.add(task)
+                task.add_done_callback(tasks.discard)
+            await send({"type": "lifespan.startup.complete"})
+        elif message["type"] == "lifespan.shutdown":
+            for task in tasks:
+                task.cancel()
+            await helpers.close_client()
+            await send({"type": "lifespan.shutdown.complete"})
+            return
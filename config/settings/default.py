@@ -132,6 +132,12 @@ CACHES: dict = {
     },
 }
 
+###############################################################################
+# Jobs
+
+JOBS_EAGER = True
+JOBS_LEASE = 60 * 15
+
 ###############################################################################
 # Sessions
 
@@ -164,6 +170,15 @@ STATIC_ROOT = os.path.join(PROJECT_ROOT, "staticfiles")
 
 CORS_ORIGIN_ALLOW_ALL = True
 
+###############################################################################
+# Django REST Framework
+
+REST_FRAMEWORK = {
+    "DEFAULT_THROTTLE_RATES": {
+        "provision": "60/hour",
+    },
+}
+
 ###############################################################################
 # Django Debug Toolbar
 
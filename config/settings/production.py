@@ -39,12 +39,21 @@ CACHES = {
         },
     },
     "explore": {
-        "BACKEND": "django.core.cache.backends.filebased.FileBasedCache",
-        "LOCATION": "/tmp/django/explore",
+        "BACKEND": "django_redis.cache.RedisCache",
+        "LOCATION": os.environ["REDIS_URL"],
+        "KEY_PREFIX": "explore",
         "TIMEOUT": 60 * 60 * 6,
+        "OPTIONS": {
+            "CLIENT_CLASS": "django_redis.client.DefaultClient",
+        },
     },
 }
 
+###############################################################################
+# Jobs
+
+JOBS_EAGER = False
+
 ###############################################################################
 # Authentication
 